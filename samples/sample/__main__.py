@@ -1,4 +1,4 @@
-import sample.cli
+from pyapp.app.cli_entry import main
 
 if __name__ == "__main__":
-    sample.cli.main()
+    main("sample.cli:APP", prog="sample")
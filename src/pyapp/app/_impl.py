@@ -0,0 +1,532 @@
+"""
+Application Implementation
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Implementation of :py:class:`pyapp.app.CliApplication`.
+
+This is kept separate from the :py:mod:`pyapp.app` package so the (relatively)
+expensive imports required to configure settings, logging, extensions and the
+injection framework are only incurred once an application is created.
+
+"""
+
+import argparse
+import io
+import logging.config
+import os
+import sys
+import warnings
+from argparse import ArgumentParser
+from argparse import Namespace as CommandOptions
+from collections.abc import Callable, Sequence
+
+import argcomplete
+
+from .. import conf, extensions
+from ..conf.base_settings import LoggingSettings
+from ..events import Event
+from ..exceptions import ApplicationExit
+from ..injection import register_factory
+from ..utils import cached_property
+from ..utils.inspect import import_root_module
+from . import builtin_handlers, init_logger
+from .arguments import CommandGroup
+
+logger = logging.getLogger(__name__)
+
+_LOG_LEVELS = ("DEBUG", "INFO", "WARN", "ERROR", "CRITICAL")
+
+# Global argument groups as (title, description, ((flags, kwargs), ...))
+_GLOBAL_ARGUMENT_GROUPS = (
+    (
+        "logging arguments",
+        "Customise log output",
+        (
+            (("--log-level",), {"choices": _LOG_LEVELS}),
+            (
+                ("--log-color", "--log-colour"),
+                {
+                    "dest": "log_color",
+                    "default": None,
+                    "action": "store_true",
+                    "help": "Force coloured output from logger (on console).",
+                },
+            ),
+            (
+                ("--log-nocolor", "--log-nocolour"),
+                {
+                    "dest": "log_color",
+                    "action": "store_false",
+                    "help": "Disable coloured output from logger (on console).",
+                },
+            ),
+        ),
+    ),
+    (
+        "check arguments",
+        "Enable and configure run-time checks",
+        (
+            (
+                ("--checks",),
+                {
+                    "dest": "checks_on_startup",
+                    "action": "store_true",
+                    "help": "Run checks on startup, any serious error will result "
+                    "in the application terminating.",
+                },
+            ),
+            (
+                ("--checks-level",),
+                {
+                    "dest": "checks_message_level",
+                    "default": "INFO",
+                    "choices": _LOG_LEVELS,
+                    "help": "Minimum level of check message to display",
+                },
+            ),
+        ),
+    ),
+    (
+        "feature flags",
+        "Enable/Disable feature flags",
+        (
+            (
+                ("--enable-flag",),
+                {
+                    "dest": "enable_feature_flags",
+                    "action": "append",
+                    "help": "Enable a named feature flag; "
+                    "this argument can be used multiple times",
+                },
+            ),
+            (
+                ("--disable-flag",),
+                {
+                    "dest": "disable_feature_flags",
+                    "action": "append",
+                    "help": "Disable a named feature flag; "
+                    "this argument can be used multiple times",
+                },
+            ),
+        ),
+    ),
+)
+
+
+def _get_event_loop():
+    """Factory for the current event loop."""
+    from asyncio import get_event_loop  # pylint: disable=import-outside-toplevel
+
+    return get_event_loop()
+
+
+def _key_help(key: str) -> str:
+    """Formats a key value from environment vars."""
+    if key in os.environ:
+        return f"{key} [{os.environ[key]}]"
+    return key
+
+
+class CliApplication(CommandGroup):
+    """Application interface that provides a CLI interface.
+
+    :param root_module: The root module for this application (used for discovery of
+        other modules)
+    :param prog: Name of your application; defaults to `sys.argv[0]`
+    :param description: A description of your application for `--help`.
+    :param version: Specify a specific version; defaults to
+        `getattr(root_module, '__version__')`
+    :param ext_allow_list: Sequence of extension names or globs that are allowed;
+        default is `None` or all extensions.
+    :param ext_block_list: Sequence of extension names or globs that are blocked;
+        default is `None` or no blocking.
+    :param application_settings: The default settings for this application;
+        defaults to `root_module.default_settings`
+    :param application_checks: Location of application checks file; defaults to
+        `root_module.checks` if it exists.
+    :param env_settings_key: Key used to define settings file in environment.
+    :param env_loglevel_key: Key used to define log level in environment
+
+    """
+
+    default_log_handler = logging.StreamHandler(sys.stderr)
+    """Log handler applied by default to the root logger."""
+
+    default_log_formatter = logging.Formatter(
+        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+    )
+    """Log formatter applied by default to the root logger handler."""
+
+    @cached_property
+    def default_color_log_formatter(self) -> logging.Formatter:
+        """Log formatter with colour applied by default to the root logger handler.
+
+        Built on first use so colorama is only imported if colour output is used.
+        """
+        # pylint: disable=import-outside-toplevel
+        import colorama
+
+        from .logging_formatter import ColourFormatter
+
+        return ColourFormatter(
+            f"{colorama.Fore.YELLOW}%(asctime)s{colorama.Fore.RESET} "
+            f"%(clevelname)s "
+            f"{colorama.Fore.LIGHTBLUE_EX}%(name)s{colorama.Fore.RESET} "
+            f"%(message)s"
+        )
+
+    env_settings_key = conf.DEFAULT_ENV_KEY
+    """Key used to define settings reference in environment."""
+
+    env_loglevel_key = "PYAPP_LOGLEVEL"
+    """Key used to define log level in environment."""
+
+    additional_handlers = (
+        builtin_handlers.checks,
+        builtin_handlers.extensions,
+        builtin_handlers.settings,
+    )
+    """Handlers to be added when builtin handlers are registered."""
+
+    # Events
+    pre_dispatch = Event[Callable[[argparse.Namespace], None]]()
+    post_dispatch = Event[Callable[[int | None, argparse.Namespace], None]]()
+    dispatch_error = Event[Callable[[Exception, argparse.Namespace], None]]()
+
+    def __init__(  # noqa: PLR0913
+        self,
+        root_module=None,
+        *,
+        prog: str = None,
+        description: str = None,
+        epilog: str = None,
+        version: str = None,
+        ext_white_list: Sequence[str] = None,
+        ext_allow_list: Sequence[str] = None,
+        ext_block_list: Sequence[str] = None,
+        application_settings: str = None,
+        application_checks: str = None,
+        env_settings_key: str = None,
+        env_loglevel_key: str = None,
+    ):
+        root_module = root_module or import_root_module()
+        self.root_module = root_module
+        super().__init__(ArgumentParser(prog, description=description, epilog=epilog))
+        self.application_version = version or getattr(
+            root_module, "__version__", "Unknown"
+        )
+        self.ext_allow_list = ext_allow_list
+        if ext_white_list:
+            warnings.warn(
+                "ext_white_list is deprecated, use ext_allow_list",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            self.ext_allow_list = ext_white_list
+        self.ext_block_list = ext_block_list
+
+        # Determine application settings (disable for standalone scripts)
+        if application_settings is None and root_module.__name__ != "__main__":
+            application_settings = f"{root_module.__name__}.default_settings"
+        self.application_settings = application_settings
+
+        # Determine application checks
+        if application_checks is None:
+            application_checks = f"{root_module.__name__}.checks"
+        self.application_checks = application_checks
+
+        # Override default value
+        if env_settings_key is not None:
+            self.env_settings_key = env_settings_key
+        if env_loglevel_key is not None:
+            self.env_loglevel_key = env_loglevel_key
+
+        # Configure Logging as early as possible
+        self._init_logger = init_logger.InitHandler(self.default_log_handler)
+        self._logging_configured = False
+        self.pre_configure_logging()
+
+        self._init_parser()
+        self.register_builtin_handlers()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<module {self.root_module.__name__}>)"
+
+    def __str__(self) -> str:
+        return self.application_summary
+
+    @property
+    def application_name(self) -> str:
+        """Name of the application."""
+        return self.parser.prog
+
+    @property
+    def application_summary(self) -> str:
+        """Summary of the application, name version and description."""
+        description = self.parser.description
+        if description:
+            return f"{self.application_name} version {self.application_version} - {description}"
+        return f"{self.application_name} version {self.application_version}"
+
+    def _init_parser(self):
+        # Create argument parser
+        self.argument(
+            "--settings",
+            help="Settings to load; either a Python module or settings URL. "
+            f"Defaults to the env variable: {_key_help(self.env_settings_key)}",
+        )
+        self.argument(
+            "--version",
+            action="version",
+            version=f"%(prog)s version: {self.application_version}",
+        )
+        self.argument(
+            "--nocolor",
+            "--nocolour",
+            dest="no_color",
+            action="store_true",
+            help="Disable colour output.",
+        )
+
+        # Values that are dependent on the application
+        argument_overrides = {
+            "--log-level": {
+                "default": os.environ.get(self.env_loglevel_key, "DEFAULT"),
+                "help": "Specify the log level to be used. "
+                f"Defaults to env variable: {_key_help(self.env_loglevel_key)}",
+            },
+        }
+
+        for title, description, arguments in _GLOBAL_ARGUMENT_GROUPS:
+            arg_group = self.argument_group(title=title, description=description)
+            for flags, kwargs in arguments:
+                overrides = argument_overrides.get(flags[0])
+                arg_group.add_argument(
+                    *flags, **(kwargs | overrides if overrides else kwargs)
+                )
+
+    def register_builtin_handlers(self):
+        """Register any built in handlers."""
+        # Register any additional handlers
+        for additional_handler in self.additional_handlers:
+            additional_handler(self)
+
+    def pre_configure_logging(self):
+        """Set some default logging so settings are logged.
+
+        The main logging configuration is in settings leaving us with a chicken
+        and egg situation.
+        """
+        self.default_log_handler.formatter = self.default_log_formatter
+
+        # Apply handler to root logger
+        logging.root.setLevel(logging.DEBUG)
+        logging.root.handlers = [self._init_logger]
+
+    @staticmethod
+    def register_factories():
+        """Register any abstract interface factories."""
+        # Registered by name so asyncio is only imported if a loop is requested
+        register_factory("asyncio.events.AbstractEventLoop", _get_event_loop)
+
+    def load_extensions(self):
+        """Load/Configure extensions."""
+        entry_points = extensions.ExtensionEntryPoints(
+            self.ext_allow_list, self.ext_block_list
+        )
+        extensions.registry.load_from(entry_points.extensions())
+        extensions.registry.register_commands(self)
+
+    def configure_settings(self, opts: CommandOptions):
+        """Configure settings container."""
+        application_settings = list(extensions.registry.default_settings)
+        if self.application_settings:
+            application_settings.append(self.application_settings)
+
+        conf.settings.configure(
+            application_settings, opts.settings, env_settings_key=self.env_settings_key
+        )
+
+    @staticmethod
+    def configure_feature_flags(opts: CommandOptions):
+        """Configure feature flags cache."""
+        if not (opts.enable_feature_flags or opts.disable_feature_flags):
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from .. import feature_flags
+
+        if opts.enable_feature_flags:
+            for flag in opts.enable_feature_flags:
+                feature_flags.DEFAULT.set(flag, True)
+
+        if opts.disable_feature_flags:
+            for flag in opts.disable_feature_flags:
+                feature_flags.DEFAULT.set(flag, False)
+
+    def get_log_formatter(self, log_color) -> logging.Formatter:
+        """Get log formatter."""
+        log_handler = self.default_log_handler
+
+        # Auto-detect colour mode
+        if (
+            log_color is None
+            and isinstance(log_handler, logging.StreamHandler)
+            and hasattr(log_handler.stream, "isatty")
+        ):
+            log_color = log_handler.stream.isatty()
+
+        # Enable colour if specified.
+        if log_color:
+            return self.default_color_log_formatter
+
+        return self.default_log_formatter
+
+    @staticmethod
+    def _apply_logging_settings():
+        """Build dict-config from settings and apply to logging."""
+        logging_config = LoggingSettings.LOGGING
+        log_handlers = LoggingSettings.LOG_HANDLERS
+        log_loggers = LoggingSettings.LOG_LOGGERS
+
+        # Only apply config if we have something to apply
+        if not (logging_config or log_handlers or log_loggers):
+            return
+
+        dict_config = dict(logging_config) if logging_config else {}
+
+        # Merge in other settings
+        if log_handlers:
+            dict_config.setdefault("handlers", {}).update(log_handlers)
+        if log_loggers:
+            dict_config.setdefault("loggers", {}).update(log_loggers)
+
+        dict_config.setdefault("version", 1)
+        logging.config.dictConfig(dict_config)
+
+    def configure_logging(self, opts: CommandOptions):
+        """Configure the logging framework."""
+        # Prevent duplicate runs
+        if self._logging_configured:
+            return
+        self._logging_configured = True
+
+        self.default_log_handler.formatter = self.get_log_formatter(opts.log_color)
+
+        # Replace root handler with the default handler
+        logging.root.handlers.pop(0)
+        logging.root.handlers.append(self.default_log_handler)
+        self._apply_logging_settings()
+
+        # Configure root log level
+        loglevel = opts.log_level
+        if loglevel == "DEFAULT":
+            handler = self.resolve_handler(opts)
+            loglevel = getattr(handler, "loglevel", logging.INFO)
+        logging.root.setLevel(loglevel)
+
+        # Replay initial entries and release the init handler
+        self._init_logger.replay()
+        self._init_logger = None
+
+    def checks_on_startup(self, opts: CommandOptions):
+        """Run checks on startup."""
+        # pylint: disable=import-outside-toplevel
+        from pyapp.checks.report import execute_report
+
+        if opts.checks_on_startup:
+            out = io.StringIO()
+
+            serious_error = execute_report(
+                out,
+                self.application_checks,
+                opts.checks_message_level,
+                verbose=True,
+                header=f"Check report for {self.application_summary}",
+            )
+            if serious_error:
+                logger.error("Check results:\n%s", out.getvalue())
+                sys.exit(4)
+            else:
+                logger.info("Check results:\n%s", out.getvalue())
+
+    def exception_report(self, exception: BaseException, opts: CommandOptions):
+        """Generate a report for any unhandled exceptions caught by the framework."""
+        logger.exception(
+            "Un-handled exception %s caught executing handler: %s",
+            exception,
+            getattr(opts, self.handler_dest),
+        )
+        return False
+
+    @staticmethod
+    def logging_shutdown():
+        """Call at shutdown to ensure logging is cleaned up."""
+        logging.shutdown()
+
+    def dispatch(self, args: Sequence[str] = None) -> None:
+        """Dispatch command to registered handler."""
+        logger.info("Starting %s", self.application_summary)
+
+        # Initialisation phase
+        _set_running_application(self)
+        self.register_factories()
+        self.load_extensions()
+
+        # Parse arguments phase
+        argcomplete.autocomplete(self.parser)
+        opts = self.parser.parse_args(args)
+
+        # Load settings and configure logger
+        self.configure_settings(opts)
+        self.configure_feature_flags(opts)
+        self.configure_logging(opts)
+
+        handler_name = getattr(opts, ":handler", None)
+        if handler_name != "checks":
+            self.checks_on_startup(opts)
+        else:
+            self.configure_settings(opts)
+
+        extensions.registry.ready()
+
+        # Dispatch to handler.
+        self.pre_dispatch(opts)
+        try:
+            exit_code = self.dispatch_handler(opts)
+
+        except Exception as ex:  # pylint: disable=broad-except
+            self.dispatch_error(ex, opts)
+            if not self.exception_report(ex, opts):
+                raise
+
+        except ApplicationExit as ex:
+            if ex.message:
+                print(f"\n\n{ex.message}", file=sys.stderr)
+            raise
+
+        except KeyboardInterrupt:
+            print("\n\nInterrupted.", file=sys.stderr)
+            sys.exit(2)
+
+        else:
+            # Provide exit code.
+            self.post_dispatch(exit_code, opts)
+            if exit_code:
+                sys.exit(exit_code)
+
+        finally:
+            self.logging_shutdown()
+
+
+CURRENT_APP: CliApplication | None = None
+
+
+def _set_running_application(app: CliApplication):
+    global CURRENT_APP  # noqa: PLW0603
+    CURRENT_APP = app
+
+
+def get_running_application() -> CliApplication:
+    """Get the current running application instance."""
+    return CURRENT_APP
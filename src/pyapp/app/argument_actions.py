@@ -102,9 +102,15 @@ class KeyValueAction(Action):
         if isinstance(values, str):
             values = (values,)
 
-        # Parse values
-        parse_value = self.parse_value
-        items.update(parse_value(value) for value in values)
+        # Parse values; partition inline unless a subclass customises parsing
+        if type(self) is KeyValueAction:
+            parts = [value.partition("=") for value in values]
+            if not all(sep for _, sep, _ in parts):
+                raise ArgumentError(self, "Expected in the form KEY=VALUE")
+            items.update([(key, value) for key, _, value in parts])
+        else:
+            parse_value = self.parse_value
+            items.update([parse_value(value) for value in values])
 
 
 class _EnumAction(Action):
@@ -115,17 +121,13 @@ class _EnumAction(Action):
         if not issubclass(enum, Enum):
             raise TypeError("type must be an Enum when using EnumAction")
         self._enum = enum
+        self._by_name = enum.__members__
 
         choices = kwargs.get("choices")
         if choices:
-            # Ensure all choices are from the enum
-            try:
-                outcome = all(c in enum for c in choices)
-            except TypeError:
-                # This path is for Python 3.8+ that does type checks in Enum.__contains__
-                outcome = False
-
-            if not outcome:
+            # Ensure all choices are members of the enum; an instance check is used
+            # as Enum.__contains__ behaviour for non-members varies between releases
+            if not all(isinstance(c, enum) for c in choices):
                 raise ValueError(f"choices contains a non {enum} entry")
 
         else:
@@ -179,11 +181,23 @@ class EnumValue(_EnumAction):
 
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        try:
+            self._by_value = {member.value: member for member in self._enum}
+        except TypeError:
+            # Unhashable values are left to the enum to resolve
+            self._by_value = {}
+
     def get_choices(self, choices: Enum | Sequence[Enum]):
         return tuple(e.value for e in choices)
 
     def to_enum(self, value):
-        return self._enum(value)
+        try:
+            return self._by_value[value]
+        except KeyError:
+            # Fallback to allow for any custom _missing_ handling
+            return self._enum(value)
 
 
 class EnumName(_EnumAction):
@@ -226,25 +240,7 @@ class EnumName(_EnumAction):
         return tuple(e.name for e in choices)
 
     def to_enum(self, value):
-        return self._enum[value]
-
-
-def _copy_items(items):
-    """
-    Extracted from argparse
-    """
-    if items is None:
-        return []
-
-    # The copy module is used only in the 'append' and 'append_const'
-    # actions, and it is needed only when the default value isn't a list.
-    # Delay its import for speeding up the common case.
-    if isinstance(items, list):
-        return items[:]
-
-    import copy  # pylint: disable=import-outside-toplevel
-
-    return copy.copy(items)
+        return self._by_name[value]
 
 
 class _AppendEnumActionMixin(_EnumAction):
@@ -254,10 +250,12 @@ class _AppendEnumActionMixin(_EnumAction):
 
     def __call__(self, parser, namespace, values, option_string=None):
         items = getattr(namespace, self.dest, None)
-        items = _copy_items(items)
-        enum = self.to_enum(values)
-        items.append(enum)
-        setattr(namespace, self.dest, items)
+        if items is None or items is self.default:
+            # Take a copy on first use so the default is never mutated, any
+            # following values are appended in place.
+            items = [] if items is None else list(items)
+            setattr(namespace, self.dest, items)
+        items.append(self.to_enum(values))
 
     def get_choices(self, choices: Enum | Sequence[Enum]):
         """
@@ -344,6 +342,14 @@ class _DateTimeAction(Action):
 
     parser: Callable[[str], Any]
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Store parser as a static method so it is never bound to the instance
+        parser = cls.__dict__.get("parser")
+        if parser is not None and not isinstance(parser, staticmethod):
+            cls.parser = staticmethod(parser)
+
     def __call__(self, parser, namespace, values, option_string=None):
         value = self.parser(values)
         setattr(namespace, self.dest, value)
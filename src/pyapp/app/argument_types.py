@@ -18,7 +18,8 @@ class RegexType(ArgumentType):
     Instances of RegexType are typically passed as type= arguments to the
     ArgumentParser add_argument() method or pyApp argument decorator.
 
-    :param regex: Regular expression string (or pre-compiled expression)
+    :param regex: Regular expression string (or pre-compiled expression); the
+        entire value must match the expression.
     :param message: Optional message if validation fails, defaults to a simple
         fallback.
 
@@ -40,13 +41,20 @@ class RegexType(ArgumentType):
 
     .. versionadded:: 4.2
 
+    .. versionchanged:: 4.17
+        The expression must match the entire value.
+
     """
 
     def __init__(self, regex, message: str = None):
+        # re.compile caches compiled expressions so repeated types share a pattern
         self._re = re.compile(regex)
-        self._message = message or f"Value does not match {self._re.pattern!r}"
+        self._match = self._re.fullmatch
+        self._message = message
 
     def __call__(self, string) -> str:
-        if not self._re.match(string):
-            raise argparse.ArgumentTypeError(self._message)
+        if self._match(string) is None:
+            raise argparse.ArgumentTypeError(
+                self._message or f"Value does not match {self._re.pattern!r}"
+            )
         return string
@@ -9,23 +9,27 @@ process of accepting and validating input/flags for commands.
 
 import abc
 import argparse
-import asyncio
+import collections.abc
+import functools
 import inspect
+import keyword
 import logging
+import types
+import weakref
 from enum import Enum
 from typing import (
     Any,
     Awaitable,
     Callable,
-    Coroutine,
     Dict,
-    Mapping,
+    Literal,
     Optional,
     Sequence,
     Tuple,
     Type,
     Union,
-    cast,
+    get_args,
+    get_origin,
 )
 
 from argcomplete.completers import BaseCompleter
@@ -46,19 +50,110 @@ Handler = Union[
 ]
 
 EMPTY = inspect.Parameter.empty
+KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+
+
+# Handler signatures; weakly keyed so the cache does not keep handlers alive
+_SIGNATURES: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Signature of a handler; cached as the same handler may be proxied repeatedly."""
+    try:
+        return _SIGNATURES[func]
+    except KeyError:
+        signature = _SIGNATURES[func] = inspect.signature(func)
+    except TypeError:
+        # Handler is either not hashable or cannot be weakly referenced
+        signature = inspect.signature(func)
+    return signature
+
+
+def _legacy_namespace_name(func: Callable) -> Optional[str]:
+    """Name of the sole namespace parameter of a plain function handler.
+
+    Determined from the code object to avoid generating a signature.
+    """
+    if (
+        not inspect.isfunction(func)
+        or hasattr(func, "__wrapped__")
+        or "__signature__" in vars(func)
+    ):
+        return None
+
+    code = func.__code__
+    if (
+        code.co_argcount != 1
+        or code.co_posonlyargcount
+        or code.co_kwonlyargcount
+        or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    ):
+        return None
+
+    name = code.co_varnames[0]
+    if func.__annotations__.get(name, EMPTY) in (EMPTY, argparse.Namespace):
+        return name
+    return None
+
+
+# Arguments generated from handler parameters; weakly keyed by handler
+_PARAMETER_ARGUMENTS: "weakref.WeakKeyDictionary[Callable, Dict[str, Argument]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _parameter_argument(func: Callable, name: str) -> "Argument":
+    """Argument generated from a handler parameter; cached with the signature."""
+    try:
+        arguments = _PARAMETER_ARGUMENTS.setdefault(func, {})
+    except TypeError:
+        # Handler is either not hashable or cannot be weakly referenced
+        arguments = {}
+
+    argument = arguments.get(name)
+    if argument is None:
+        parameter = _cached_signature(func).parameters[name]
+        argument = arguments[name] = Argument.from_parameter(name, parameter)
+    return argument
+
+
+def _opts_value(dest: str) -> str:
+    """Expression that fetches a destination from the options namespace."""
+    if dest.isidentifier() and not keyword.iskeyword(dest):
+        return f"opts.{dest}"
+    return f"getattr(opts, {dest!r})"
+
+
+@functools.cache
+def _build_caller(
+    args: tuple[tuple[str, str], ...], require_namespace: Union[str, bool]
+) -> Callable[[Handler, argparse.Namespace], Any]:
+    """Generate a function that calls a handler with values from the options.
+
+    Generated functions are shared between handlers with the same arguments.
+    """
+    kwargs = [f"{name}={_opts_value(dest)}" for name, dest in args]
+    if require_namespace:
+        kwargs.append(f"{require_namespace}=opts")
+    source = f"def call(handler, opts):\n    return handler({', '.join(kwargs)})\n"
+
+    namespace = {}
+    exec(source, namespace)  # noqa: S102 - source is built from argument names
+    return namespace["call"]
 
 
 class ParserBase:
     """Base class for handling parsers."""
 
+    __slots__ = ("parser", "argument")
+
     def __init__(self, parser: argparse.ArgumentParser):
         self.parser = parser
-
-    def argument(self, *name_or_flags, **kwargs) -> argparse.Action:
-        """
-        Add argument to proxy
-        """
-        return self.parser.add_argument(*name_or_flags, **kwargs)
+        # Add argument to proxy; bound directly to the parser
+        self.argument: Callable[..., argparse.Action] = parser.add_argument
 
     def argument_group(self, *, title: str = None, description: str = None):
         """Add an argument group to proxy.
@@ -77,7 +172,17 @@ class CommandProxy(ParserBase):
 
     """
 
-    __slots__ = ("__name__", "handler", "_args", "_require_namespace")
+    # __doc__ and __module__ are class attributes so cannot be slots and are
+    # stored in the instance dict.
+    __slots__ = (
+        "__name__",
+        "__dict__",
+        "handler",
+        "loglevel",
+        "_args",
+        "_require_namespace",
+        "_call",
+    )
 
     def __init__(
         self,
@@ -100,31 +205,39 @@ class CommandProxy(ParserBase):
 
         # Add any existing arguments
         if hasattr(handler, "arguments__"):
-            for arg in handler.arguments__:
+            # Decorators are applied bottom up so are collected in reverse
+            for arg in reversed(handler.arguments__):
                 arg.register_with_proxy(self)
             del handler.arguments__
 
         self._args = []
         self._require_namespace = False
+        self._call = None
 
         # Parse out any additional arguments
         self._extract_args(handler)
 
     def _extract_args(self, func):
         """Extract args from signature and turn into command line args."""
-        sig = inspect.signature(func)
+        # Fast path for the common legacy handler that only accepts the namespace
+        name = _legacy_namespace_name(func)
+        if name:
+            self._require_namespace = name
+            return
+
+        params = tuple(_cached_signature(func).parameters.items())
 
         # Backwards compatibility
-        if len(sig.parameters) == 1:
-            ((name, parameter),) = sig.parameters.items()
+        if len(params) == 1:
+            ((name, parameter),) = params
             if (
-                parameter.kind is parameter.POSITIONAL_OR_KEYWORD
-                and parameter.annotation in (parameter.empty, argparse.Namespace)
+                parameter.kind is POSITIONAL_OR_KEYWORD
+                and parameter.annotation in (EMPTY, argparse.Namespace)
             ):
                 self._require_namespace = name
                 return
 
-        for idx, (name, parameter) in enumerate(sig.parameters.items()):
+        for idx, (name, parameter) in enumerate(params):
             if parameter.annotation is argparse.Namespace:
                 self._require_namespace = name
             elif name == "self" and idx == 0:
@@ -133,15 +246,17 @@ class CommandProxy(ParserBase):
                 action = arg.register_with_proxy(self)
                 self._args.append((name, action.dest))
             else:
-                arg = Argument.from_parameter(name, parameter)
+                arg = _parameter_argument(func, name)
                 action = arg.register_with_proxy(self)
                 self._args.append((name, action.dest))
 
     def __call__(self, opts: argparse.Namespace):
-        kwargs = {kwarg: getattr(opts, opt_attr) for kwarg, opt_attr in self._args}
-        if self._require_namespace:
-            kwargs[self._require_namespace] = opts
-        return self.handler(**kwargs)
+        call = self._call
+        if call is None:
+            call = self._call = _build_caller(
+                tuple(self._args), self._require_namespace
+            )
+        return call(self.handler, opts)
 
 
 class AsyncCommandProxy(CommandProxy):
@@ -151,8 +266,14 @@ class AsyncCommandProxy(CommandProxy):
     """
 
     def __call__(self, opts: argparse.Namespace):
-        func = cast(Coroutine, super().__call__(opts))
-        return async_run(func)
+        return async_run(CommandProxy.__call__(self, opts))
+
+
+def _proxy_type(handler: Handler) -> Type[CommandProxy]:
+    """Proxy type for a handler; async handlers require an event loop."""
+    return (
+        AsyncCommandProxy if inspect.iscoroutinefunction(handler) else CommandProxy
+    )
 
 
 class ArgumentType(abc.ABC):
@@ -163,6 +284,135 @@ class ArgumentType(abc.ABC):
         """Construct a value from type."""
 
 
+def _generic_type(args: tuple) -> Optional[type]:
+    """Type of the first argument of a generic."""
+    return args[0] if args else None
+
+
+def _handle_union(args: tuple, positional: bool, kwargs: Dict[str, Any]) -> type:
+    if len(args) != 2 or type(None) not in args:  # noqa: PLR2004
+        raise TypeError("Only Optional[TYPE] or Union[TYPE, None] are supported")
+
+    if positional:
+        kwargs["nargs"] = "?"
+    else:
+        kwargs["default"] = None
+    return _generic_type(args)
+
+
+def _handle_literal(args: tuple, _: bool, kwargs: Dict[str, Any]) -> type:
+    choices = args
+    choice_type = type(choices[0])
+    if choice_type not in (str, int):
+        raise TypeError("Only str and int Literal types are supported")
+    # Ensure only a single type is supplied
+    if not all(isinstance(choice, choice_type) for choice in choices):
+        raise TypeError("All literal values must be the same type")
+
+    kwargs["choices"] = choices
+    return choice_type
+
+
+def _handle_tuple(args: tuple, _: bool, kwargs: Dict[str, Any]) -> type:
+    kwargs["nargs"] = len(args)
+    return _generic_type(args)
+
+
+def _handle_sequence(args: tuple, positional: bool, kwargs: Dict[str, Any]) -> type:
+    if len(args) == 1 and issubclass(args[0], Enum):
+        kwargs["action"] = AppendEnumName
+    elif positional:
+        kwargs["nargs"] = "+"
+    else:
+        kwargs["action"] = "append"
+    return _generic_type(args)
+
+
+def _handle_mapping(args: tuple, positional: bool, kwargs: Dict[str, Any]) -> type:
+    kwargs["action"] = KeyValueAction
+    if positional:
+        kwargs["nargs"] = "+"
+    return _generic_type(args)
+
+
+@functools.cache
+def _type_kwargs(  # noqa: PLR0911 - a return per category of annotation
+    type_: type, positional: bool, has_default: bool
+) -> Tuple[Tuple[Tuple[str, Any], ...], Optional[type]]:
+    """Argument kwargs and type for a plain type annotation.
+
+    Cached as the same annotations (eg str, int) are used throughout an
+    application.
+    """
+    if type_ is bool:
+        return (("action", "store_true"),), None
+
+    if type_ is dict:
+        if positional:
+            return (("action", KeyValueAction), ("nargs", "+")), None
+        return (("action", KeyValueAction),), None
+
+    if type_ in (list, tuple):
+        if positional:
+            return (("nargs", "+"),), None
+        return (("action", "append"),), None
+
+    if issubclass(type_, Enum):
+        return (("action", EnumName),), type_
+
+    if action := TYPE_ACTIONS.get(type_):
+        return (("action", action),), None
+
+    if not positional and not has_default:
+        return (("required", True),), type_
+
+    return (), type_
+
+
+# Handlers for generic types keyed by the origin of the generic
+_GENERIC_HANDLERS = {
+    Union: _handle_union,
+    types.UnionType: _handle_union,
+    Literal: _handle_literal,
+    tuple: _handle_tuple,
+    list: _handle_sequence,
+    collections.abc.Sequence: _handle_sequence,
+    dict: _handle_mapping,
+    collections.abc.Mapping: _handle_mapping,
+}
+
+# Handlers for origins not found above, checked in order
+_GENERIC_BASE_HANDLERS = (
+    (tuple, _handle_tuple),
+    (collections.abc.Sequence, _handle_sequence),
+    (collections.abc.Mapping, _handle_mapping),
+)
+
+
+def _generic_kwargs(
+    origin, type_, positional: bool
+) -> Tuple[Tuple[Tuple[str, Any], ...], Optional[type]]:
+    """Argument kwargs and type for a generic type annotation.
+
+    Not cached as typing compares Literal and Union members as sets, so
+    different annotations would share a result.
+    """
+    handler = _GENERIC_HANDLERS.get(origin)
+    if handler is None:
+        # Fallback to checking bases for less common origins eg deque
+        if isinstance(origin, type):
+            for base, base_handler in _GENERIC_BASE_HANDLERS:
+                if issubclass(origin, base):
+                    handler = base_handler
+                    break
+        if handler is None:
+            raise TypeError(f"Unsupported generic type: {origin!r}")
+
+    kwargs = {}
+    type_ = handler(get_args(type_), positional, kwargs)
+    return tuple(kwargs.items()), type_
+
+
 class Argument:
     """
     Decorator for adding arguments to a handler.
@@ -217,60 +467,15 @@ class Argument:
         )
 
     @staticmethod
-    def _handle_generics(  # noqa: PLR0912
+    def _handle_generics(
         origin, type_, positional: bool, kwargs: Dict[str, Any]
     ) -> type:
         """
         Handle generic types
         """
-        name = str(origin)
-        if name == "typing.Union":
-            if (
-                len(type_.__args__) == 2  # noqa: PLR2004
-                and type(None) in type_.__args__
-            ):
-                if positional:
-                    kwargs["nargs"] = "?"
-                else:
-                    kwargs["default"] = None
-            else:
-                raise TypeError(
-                    "Only Optional[TYPE] or Union[TYPE, None] are supported"
-                )
-
-        elif name == "typing.Literal":
-            choices = type_.__args__
-            choice_type = type(choices[0])
-            if choice_type not in (str, int):
-                raise TypeError("Only str and int Literal types are supported")
-            # Ensure only a single type is supplied
-            if not all(isinstance(choice, choice_type) for choice in choices):
-                raise TypeError("All literal values must be the same type")
-
-            kwargs["choices"] = type_.__args__
-            return choice_type
-
-        elif issubclass(origin, Tuple):
-            kwargs["nargs"] = len(type_.__args__)
-
-        elif issubclass(origin, Sequence):
-            args = type_.__args__
-            if len(args) == 1 and issubclass(args[0], Enum):
-                kwargs["action"] = AppendEnumName
-            elif positional:
-                kwargs["nargs"] = "+"
-            else:
-                kwargs["action"] = "append"
-
-        elif issubclass(origin, Mapping):
-            kwargs["action"] = KeyValueAction
-            if positional:
-                kwargs["nargs"] = "+"
-
-        else:
-            raise TypeError(f"Unsupported generic type: {origin!r}")
-
-        return type_.__args__[0] if type_.__args__ else None
+        generic_kwargs, type_ = _generic_kwargs(origin, type_, positional)
+        kwargs.update(generic_kwargs)
+        return type_
 
     @staticmethod
     def _handle_types(
@@ -279,33 +484,8 @@ class Argument:
         """
         Handle types
         """
-        if type_ is bool:
-            kwargs["action"] = "store_true"
-            return None
-
-        if type_ is dict:
-            kwargs["action"] = KeyValueAction
-            if positional:
-                kwargs["nargs"] = "+"
-            return None
-
-        if type_ in (list, tuple):
-            if positional:
-                kwargs["nargs"] = "+"
-            else:
-                kwargs["action"] = "append"
-            return None
-
-        if issubclass(type_, Enum):
-            kwargs["action"] = EnumName
-
-        elif action := TYPE_ACTIONS.get(type_):
-            kwargs["action"] = action
-            return None
-
-        elif not positional and "default" not in kwargs:
-            kwargs["required"] = True
-
+        type_kwargs, type_ = _type_kwargs(type_, positional, "default" in kwargs)
+        kwargs.update(type_kwargs)
         return type_
 
     @classmethod
@@ -318,7 +498,7 @@ class Argument:
             Determine arguments from handler signature.
 
         """
-        positional = parameter.kind is not parameter.KEYWORD_ONLY
+        positional = parameter.kind is not KEYWORD_ONLY
         type_ = parameter.annotation
         default = parameter.default
         flag = name.upper() if positional else f"--{name.replace('_', '-')}"
@@ -338,7 +518,7 @@ class Argument:
             kwargs.setdefault("default", default)
 
         # Handle type variances
-        origin = getattr(type_, "__origin__", None)
+        origin = get_origin(type_)
         if origin is not None:
             type_ = cls._handle_generics(origin, type_, positional, kwargs)
         elif isinstance(type_, type):
@@ -371,31 +551,36 @@ class Argument:
         self.name_or_flags = name_or_flags
         self.completer = completer
 
-        # Filter out None values
-        kwargs = (
-            ("action", action),
-            ("nargs", nargs),
-            ("const", const),
-            ("type", type),
-            ("choices", choices),
-            ("required", required),
-            ("help", help_text),
-            ("metavar", metavar),
-            ("dest", dest),
-        )
-        self.kwargs = {key: val for key, val in kwargs if val is not None}
+        # Only pass on values that have been supplied
+        self.kwargs = kwargs = {}
+        if action is not None:
+            kwargs["action"] = action
+        if nargs is not None:
+            kwargs["nargs"] = nargs
+        if const is not None:
+            kwargs["const"] = const
+        if type is not None:
+            kwargs["type"] = type
+        if choices is not None:
+            kwargs["choices"] = choices
+        if required is not None:
+            kwargs["required"] = required
+        if help_text is not None:
+            kwargs["help"] = help_text
+        if metavar is not None:
+            kwargs["metavar"] = metavar
+        if dest is not None:
+            kwargs["dest"] = dest
         if default is not EMPTY:
-            self.kwargs["default"] = default
+            kwargs["default"] = default
 
     def __call__(
         self, func: Union[Handler, CommandProxy]
     ) -> Union[Handler, CommandProxy]:
         if isinstance(func, CommandProxy):
             self.register_with_proxy(func)
-        elif hasattr(func, "arguments__"):
-            func.arguments__.insert(0, self)
         else:
-            func.arguments__ = [self]
+            vars(func).setdefault("arguments__", []).append(self)
 
         return func
 
@@ -416,15 +601,11 @@ argument = Argument
 class CommandGroup(ParserBase):
     """Group of commands."""
 
-    def __init__(
-        self,
-        parser: argparse.ArgumentParser,
-        _prefix: str = None,
-        _handlers: Dict[str, Handler] = None,
-    ):
+    def __init__(self, parser: argparse.ArgumentParser, _prefix: str = None):
         super().__init__(parser)
         self._prefix = _prefix
-        self._handlers: Dict[str, Handler] = {} if _handlers is None else _handlers
+        # Handlers (or nested groups) keyed by the name (or alias) used on the CLI
+        self._handlers: Dict[str, Union[Handler, "CommandGroup"]] = {}
 
         self._sub_parsers = parser.add_subparsers(dest=self.handler_dest)
         self._default_handler = self.default_handler
@@ -436,13 +617,9 @@ class CommandGroup(ParserBase):
 
     def _add_handler(self, handler, name, aliases):
         # Add proxy to handler list
-        handler_name = f"{self._prefix}:{name}" if self._prefix else name
-        self._handlers[handler_name] = handler
-
-        # Add proxy to handler list
+        self._handlers[name] = handler
         for alias in aliases:
-            handler_alias = f"{self._prefix}:{alias}" if self._prefix else alias
-            self._handlers[handler_alias] = handler
+            self._handlers[alias] = handler
 
     def create_command_group(
         self, name: str, *, aliases: Sequence[str] = (), help_text: str = None
@@ -460,9 +637,8 @@ class CommandGroup(ParserBase):
         group = CommandGroup(
             self._sub_parsers.add_parser(name, aliases=aliases, help=help_text),
             f"{self._prefix}:{name}" if self._prefix else name,
-            self._handlers,
         )
-        self._add_handler(group.dispatch_handler, name, aliases)
+        self._add_handler(group, name, aliases)
 
         return group
 
@@ -500,18 +676,9 @@ class CommandGroup(ParserBase):
                 kwargs["help"] = help_text_.strip()
 
             name_ = name or func.__name__
-            if asyncio.iscoroutinefunction(func):
-                proxy = AsyncCommandProxy(
-                    func,
-                    self._sub_parsers.add_parser(name_, **kwargs),
-                    loglevel=loglevel,
-                )
-            else:
-                proxy = CommandProxy(
-                    func,
-                    self._sub_parsers.add_parser(name_, **kwargs),
-                    loglevel=loglevel,
-                )
+            proxy = _proxy_type(func)(
+                func, self._sub_parsers.add_parser(name_, **kwargs), loglevel=loglevel
+            )
 
             self._add_handler(proxy, name_, aliases)
 
@@ -526,10 +693,7 @@ class CommandGroup(ParserBase):
             Async handlers supported.
 
         """
-        if asyncio.iscoroutinefunction(handler):
-            self._default_handler = AsyncCommandProxy(handler, self.parser)
-        else:
-            self._default_handler = CommandProxy(handler, self.parser)
+        self._default_handler = _proxy_type(handler)(handler, self.parser)
         return handler
 
     def default_handler(self, _: argparse.Namespace) -> int:
@@ -539,11 +703,23 @@ class CommandGroup(ParserBase):
         return 1
 
     def resolve_handler(self, opts: argparse.Namespace) -> Handler:
-        """Resolve a command handler."""
-        handler_name = getattr(opts, self.handler_dest, None)
-        if self._prefix:
-            handler_name = f"{self._prefix}:{handler_name}"
-        return self._handlers.get(handler_name, self._default_handler)
+        """Resolve a command handler.
+
+        Nested command groups are descended in place so the handler of the
+        selected command is returned directly.
+
+        """
+        group = self
+        while True:
+            handler_name = getattr(opts, group.handler_dest, None)
+            try:
+                handler = group._handlers[handler_name]
+            except KeyError:
+                return group._default_handler
+
+            if not isinstance(handler, CommandGroup):
+                return handler
+            group = handler
 
     def dispatch_handler(self, opts: argparse.Namespace) -> int:
         """Resolve the correct handler and call it with supplied options namespace."""
@@ -12,6 +12,9 @@ from typing import Optional
 
 from pyapp.app.arguments import CommandGroup, argument
 
+# Output file type shared by the report handlers
+_OUTPUT_FILE = FileType(mode="w")
+
 
 def checks(app):
     """
@@ -32,7 +35,7 @@ def checks(app):
         "--out",
         dest="out",
         default=sys.stdout,
-        type=FileType(mode="w"),
+        type=_OUTPUT_FILE,
         help_text="File to output check report to; default is stdout.",
     )
     @argument(
@@ -73,7 +76,7 @@ def extensions(app: CommandGroup):
         "--out",
         dest="out",
         default=sys.stdout,
-        type=FileType(mode="w"),
+        type=_OUTPUT_FILE,
         help_text="File to output extension report to; default is stdout.",
     )
     @app.command(name="extensions")
@@ -95,7 +98,7 @@ def settings(app: CommandGroup):
         "--out",
         dest="out",
         default=sys.stdout,
-        type=FileType(mode="w"),
+        type=_OUTPUT_FILE,
         help_text="File to output settings report to; default is stdout.",
     )
     def _handler(opts) -> Optional[int]:
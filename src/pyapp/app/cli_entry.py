@@ -0,0 +1,74 @@
+"""
+CLI Entry
+~~~~~~~~~
+
+Thin entry point for applications that answers trivial requests without
+importing the full :py:class:`pyapp.app.CliApplication` machinery.
+
+Use from your applications ``__main__.py``::
+
+    from pyapp.app.cli_entry import main
+
+    if __name__ == "__main__":
+        main("my_app.cli:app")
+
+A request for ``--version`` is answered directly from the root package
+``__version__``; any other request falls through to the applications
+:py:meth:`pyapp.app.CliApplication.dispatch` method.
+
+.. note:: Help output (``--help``) depends on the commands registered with the
+    application (including commands registered by extensions) so is always
+    generated by the full application.
+
+.. autofunction:: main
+
+"""
+
+import importlib
+from argparse import ArgumentParser
+from collections.abc import Sequence
+
+
+def _import_app(app_ref: str):
+    """Import an application instance from a `module:attribute` reference."""
+    module_name, _, attribute = app_ref.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected a `module:attribute` reference: {app_ref!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _root_version(app_ref: str) -> str:
+    """Determine the version from the root package of the application."""
+    module_name, _, _ = app_ref.partition(":")
+    root_module = importlib.import_module(module_name.split(".")[0])
+    return getattr(root_module, "__version__", "Unknown")
+
+
+def main(
+    app_ref: str,
+    *,
+    prog: str = None,
+    version: str = None,
+    args: Sequence[str] = None,
+) -> None:
+    """Entry point that only imports the application when required.
+
+    :param app_ref: Reference to the application instance in the form
+        ``module:attribute``.
+    :param prog: Name of your application; this should match the value supplied
+        to the application; defaults to `sys.argv[0]`.
+    :param version: Specify a specific version; this should match the value
+        supplied to the application; defaults to `root_package.__version__`.
+    :param args: Arguments to parse; defaults to `sys.argv[1:]`.
+
+    """
+    parser = ArgumentParser(prog, add_help=False)
+    parser.add_argument("--version", action="store_true")
+    opts, remaining = parser.parse_known_args(args)
+
+    if opts.version and not remaining:
+        version = version or _root_version(app_ref)
+        print(f"{parser.prog} version: {version}")
+        parser.exit()
+
+    _import_app(app_ref).dispatch(args)
@@ -1,7 +1,8 @@
 """Logger used in the initial setup."""
 
 import logging
-from typing import List
+from collections import deque
+from typing import Deque
 
 
 class InitHandler(logging.Handler):
@@ -9,26 +10,42 @@ class InitHandler(logging.Handler):
     level, it is then replayed once logging has been initialised.
     """
 
-    def __init__(self, handler: logging.Handler, pass_through_level=logging.WARNING):
+    def __init__(
+        self,
+        handler: logging.Handler,
+        pass_through_level=logging.WARNING,
+        max_records: int = 10_000,
+        store_level=logging.DEBUG,
+    ):
         super().__init__(logging.DEBUG)
         self.handler = handler
         self.pass_through_level = pass_through_level
-        self._store: List[logging.LogRecord] = []
+        self.store_level = store_level
+        # Bounded so memory is limited if records are never replayed
+        self._store: Deque[logging.LogRecord] = deque(maxlen=max_records)
 
     def handle(self, record: logging.LogRecord) -> None:
         """Handle record"""
-        self._store.append(record)
-        if record.levelno >= self.pass_through_level:
+        levelno = record.levelno
+        if levelno >= self.store_level:
+            self._store.append(record)
+        if levelno >= self.pass_through_level:
             super().handle(record)
 
     def replay(self):
         """Replay stored log records"""
 
-        for record in self._store:
-            logger = logging.getLogger(record.name)
+        # Loggers are cached locally to avoid taking the logging lock per record
+        loggers = {}
+        store = self._store
+        while store:
+            record = store.popleft()
+            try:
+                logger = loggers[record.name]
+            except KeyError:
+                logger = loggers[record.name] = logging.getLogger(record.name)
             if logger.isEnabledFor(record.levelno):
                 logger.handle(record)
-        self._store.clear()
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit the record"""
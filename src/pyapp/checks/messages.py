@@ -2,8 +2,9 @@
 Messages
 """
 
+import sys
 from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING, getLevelName
-from traceback import format_exc
+from traceback import format_exception
 from typing import Any
 
 __all__ = (
@@ -57,15 +58,14 @@ class CheckMessage:
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return all(
-                getattr(self, attr) == getattr(other, attr)
-                for attr in ("level", "msg", "hint", "obj")
+            return (self.level, self.msg, self.hint, self.obj) == (
+                other.level,
+                other.msg,
+                other.hint,
+                other.obj,
             )
         return NotImplemented
 
-    def __ne__(self, other):
-        return not self == other
-
     def __str__(self) -> str:
         obj = "?" if self.obj is None else str(self.obj)
         hint = f"\n\tHINT: {self.hint}" if self.hint else ""
@@ -93,84 +93,72 @@ class CheckMessage:
         return self.level >= level
 
 
-class Debug(CheckMessage):
+class _LevelMessage(CheckMessage):
     """
-    Debug check message
+    Check message with a level defined by the message type
     """
 
     __slots__ = ()
 
+    _level: int
+
     def __init__(
         self,
         msg: str,
         hint: str = None,
         obj: Any = None,
     ):
-        super().__init__(DEBUG, msg, hint, obj)
+        super().__init__(self._level, msg, hint, obj)
+
+
+class Debug(_LevelMessage):
+    """
+    Debug check message
+    """
+
+    __slots__ = ()
 
+    _level = DEBUG
 
-class Info(CheckMessage):
+
+class Info(_LevelMessage):
     """
     Info check message
     """
 
     __slots__ = ()
 
-    def __init__(
-        self,
-        msg: str,
-        hint: str = None,
-        obj: Any = None,
-    ):
-        super().__init__(INFO, msg, hint, obj)
+    _level = INFO
 
 
-class Warn(CheckMessage):
+class Warn(_LevelMessage):
     """
     Warning check message
     """
 
     __slots__ = ()
 
-    def __init__(
-        self,
-        msg: str,
-        hint: str = None,
-        obj: Any = None,
-    ):
-        super().__init__(WARNING, msg, hint, obj)
+    _level = WARNING
 
 
-class Error(CheckMessage):
+class Error(_LevelMessage):
     """
     Error check message
     """
 
     __slots__ = ()
 
-    def __init__(
-        self,
-        msg: str,
-        hint: str = None,
-        obj: Any = None,
-    ):
-        super().__init__(ERROR, msg, hint, obj)
+    _level = ERROR
 
 
-class Critical(CheckMessage):
+class Critical(_LevelMessage):
     """
     Critical check message
     """
 
     __slots__ = ()
 
-    def __init__(
-        self,
-        msg: str,
-        hint: str = None,
-        obj: Any = None,
-    ):
-        super().__init__(CRITICAL, msg, hint, obj)
+    _level = CRITICAL
 
 
 class UnhandledException(CheckMessage):
@@ -184,4 +172,20 @@ class UnhandledException(CheckMessage):
         hint: str = None,
         obj: Any = None,
     ):
-        super().__init__(ERROR, msg or "Unhandled Exception", hint or format_exc(), obj)
+        # Capture the exception now, it is only formatted if the hint is used
+        self._exc_info = None if hint else sys.exc_info()
+        super().__init__(ERROR, msg or "Unhandled Exception", hint, obj)
+
+    @property
+    def hint(self) -> str:
+        """
+        Hint; defaults to the formatted traceback of the exception.
+        """
+        if self._exc_info is not None:
+            self._hint = "".join(format_exception(*self._exc_info))
+            self._exc_info = None
+        return self._hint
+
+    @hint.setter
+    def hint(self, value: str):
+        self._hint = value
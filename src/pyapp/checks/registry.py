@@ -6,6 +6,7 @@ Location for registering and listing checks.
 
 """
 
+import importlib
 from itertools import chain
 from typing import Callable, Iterable, List, NamedTuple, Sequence, TypeVar, Union
 
@@ -34,6 +35,15 @@ class CheckResult(NamedTuple):
 class CheckRegistry(List[Check]):
     """Registry list for checks."""
 
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Set of registered checks; avoids a linear search of the list
+        self._seen = set(self)
+
+    def clear(self):
+        super().clear()
+        self._seen.clear()
+
     def register(
         self,
         check: Union[Check, str] = None,
@@ -48,8 +58,13 @@ class CheckRegistry(List[Check]):
         """
 
         def inner(func):
-            func._check__tags = tags
-            if func not in self:
+            # Stored as a set so filtering by tag needs no conversion
+            func._check__tags = getattr(func, "_check__tags", frozenset()).union(tags)
+            if func not in self._seen:
+                self._seen.add(func)
+                self.append(func)
+            elif func not in self:
+                # Previously registered but removed from the list
                 self.append(func)
             return func
 
@@ -63,14 +78,28 @@ class CheckRegistry(List[Check]):
     def checks_by_tags(self, tags: Iterable[str] = None):
         """Return an iterator of checks that relate to a specific tag (or tags)"""
         if tags:
-            tags = set(tags)
+            tags = frozenset(tags)
             return (
                 check
                 for check in self
-                if set(getattr(check, "_check__tags", [])) & tags
+                if not tags.isdisjoint(getattr(check, "_check__tags", ()))
             )
         return iter(self)
 
+    @staticmethod
+    def _run_check(check: Check) -> Sequence[CheckMessage]:
+        """Run a single check and normalise the returned messages."""
+        # Detect attached checks (or a class with checks)
+        check_func = getattr(check, "checks", check)
+        try:
+            messages = check_func(settings=settings)
+        except Exception:  # noqa:
+            messages = UnhandledException("Unhandled Exception")
+
+        if isinstance(messages, CheckMessage):
+            return (messages,)
+        return messages or ()
+
     def run_checks_iter(self, tags: Iterable[str] = None, pre_callback=None):
         """Iterate through all registered checks and run each to return messages.
 
@@ -78,25 +107,12 @@ class CheckRegistry(List[Check]):
         :param pre_callback: Callback triggered before each check is executed.
 
         """
-        check_kwargs = {"settings": settings}
-
+        run_check = self._run_check
         for check in self.checks_by_tags(tags):
             if pre_callback:
                 pre_callback(check)
 
-            # Detect attached checks (or a class with checks)
-            check_func = check.checks if hasattr(check, "checks") else check
-            try:
-                messages = check_func(**check_kwargs)
-            except Exception:  # noqa:
-                messages = UnhandledException("Unhandled Exception")
-
-            if isinstance(messages, CheckMessage):
-                yield CheckResult(check, (messages,))
-            elif messages:
-                yield CheckResult(check, messages)
-            else:
-                yield CheckResult(check, tuple())
+            yield CheckResult(check, run_check(check))
 
     def run_checks(self, tags: Iterable[str] = None) -> Sequence[CheckMessage]:
         """
@@ -106,7 +122,7 @@ class CheckRegistry(List[Check]):
 
         """
         return tuple(
-            chain.from_iterable(r.messages for r in self.run_checks_iter(tags))
+            chain.from_iterable(map(self._run_check, self.checks_by_tags(tags)))
         )
 
 
@@ -123,8 +139,7 @@ def import_checks():
 
     By importing the modules this ensures that checks are registered.
     """
-    for location in settings.CHECK_LOCATIONS:
-        __import__(location)
-
-    for location in extensions.registry.check_locations:
-        __import__(location)
+    locations = chain(settings.CHECK_LOCATIONS, extensions.registry.check_locations)
+    # Dedupe locations while preserving the import order
+    for location in dict.fromkeys(locations):
+        importlib.import_module(location)
@@ -3,4 +3,12 @@ Compatibility between Python Releases
 """
 __all__ = ("async_run",)
 
-from asyncio import run as async_run
+
+def async_run(main, **kwargs):
+    """Run a coroutine; see :py:func:`asyncio.run`.
+
+    The asyncio import is deferred until a coroutine is actually run.
+    """
+    from asyncio import run  # pylint: disable=import-outside-toplevel
+
+    return run(main, **kwargs)
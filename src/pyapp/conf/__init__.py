@@ -102,6 +102,7 @@ import os
 import pickle
 import warnings
 from collections.abc import Iterable, Sequence
+from operator import itemgetter
 from typing import IO, Any, Protocol
 
 from . import base_settings, loaders
@@ -149,42 +150,55 @@ class ModifySettingsContext:
 
     """
 
+    __slots__ = ("_container", "_original", "_added", "_reset")
+
     def __init__(self, settings_container: "Settings"):
-        self.__dict__.update(_container=settings_container, _roll_back=[])
+        # Bypass __setattr__ which applies changes to the settings container
+        object.__setattr__(self, "_container", settings_container)
+        object.__setattr__(self, "_original", {})
+        object.__setattr__(self, "_added", set())
+        object.__setattr__(self, "_reset", False)
 
     def __enter__(self) -> "ModifySettingsContext":
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore the state by running the rollback actions in reverse
-        for action, args in reversed(self._roll_back):
-            action(*args)
+        # Restore the state from the values recorded before modification
+        items = self._container.__dict__
+        if self._reset:
+            for key in self._container.keys:
+                del items[key]
+        for key in self._added:
+            items.pop(key, None)
+        items.update(self._original)
 
     def __getattr__(self, item):
         # Proxy the underlying settings container
         return getattr(self._container, item)
 
-    def __setattr__(self, key, value):
-        items = self._container.__dict__
+    def _record(self, key: str, items: dict[str, Any]):
+        """Record the state of a key before it is first modified."""
+        if key in self._original or key in self._added:
+            return
+        if self._reset and key.isupper():
+            # All settings were recorded by reset_settings
+            return
 
-        if key in items:  # noqa: SIM108
-            # Prepare an action that puts the current value back
-            action = items.__setitem__, (key, items.get(key))
+        if key in items:
+            self._original[key] = items[key]
         else:
-            # Prepare an action to remove the key again
-            action = items.__delitem__, (key,)
-        self._roll_back.append(action)
+            self._added.add(key)
 
+    def __setattr__(self, key, value):
+        items = self._container.__dict__
+        self._record(key, items)
         items[key] = value
 
     def __delattr__(self, item):
         items = self._container.__dict__
 
         if item in items:
-            # Prepare an action that puts the current value back
-            action = items.__setitem__, (item, items.get(item))
-            self._roll_back.append(action)
-
+            self._record(item, items)
             del items[item]
 
     def reset_settings(self):
@@ -195,25 +209,21 @@ class ModifySettingsContext:
         This is useful for testing CLI entry points
         """
         container = self._container
+        items = container.__dict__
+
+        # Record all existing settings (preserving order) and remove them
+        if not self._reset:
+            added = self._added
+            current = {key: items[key] for key in container.keys if key not in added}
+            object.__setattr__(self, "_original", {**current, **self._original})
+            object.__setattr__(self, "_reset", True)
 
-        # Save and remove existing settings
-        saved_settings = [(key, container.__dict__.pop(key)) for key in container.keys]
+        for key in container.keys:
+            del items[key]
 
         # Initialise base settings
         container._populate_base_settings()  # pylint: disable=protected-access
 
-        def restore_():
-            # Remove new settings
-            for key in container.keys:
-                del container.__dict__[key]
-
-            # Restore saved settings
-            container.__dict__.update(saved_settings)
-
-        # Add restore action
-        action = restore_, ()
-        self._roll_back.append(action)
-
 
 class Settings:
     """Settings container."""
@@ -257,9 +267,10 @@ class Settings:
 
     def items(self) -> Iterable[tuple[str, Any]]:
         """Return a sorted iterable of all key/value pairs of settings."""
-        data = self.__dict__
-        for key in sorted(self.keys):
-            yield key, data[key]
+        return sorted(
+            (item for item in self.__dict__.items() if item[0].isupper()),
+            key=itemgetter(0),
+        )
 
     def load(self, loader: Loader, apply_method=None):
         """Load settings from a loader instance.
@@ -269,10 +280,11 @@ class Settings:
         See :py:class:`pyapp.conf.loaders.ModuleLoader` as an example.
 
         """
-        apply_method = apply_method or self.__dict__.__setitem__
+        items = self.__dict__
+        apply_method = apply_method or items.__setitem__
 
         loader_key = str(loader)
-        if loader_key in self.SETTINGS_SOURCES:
+        if loader_key in items["SETTINGS_SOURCES"]:
             warnings.warn(
                 f"Settings already loaded: {loader_key}",
                 category=ImportWarning,
@@ -284,16 +296,18 @@ class Settings:
         logger.info("Loading settings from: %s", loader_key)
 
         # Apply values from loader
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         with loader:
             for key, value in loader:
-                logger.debug("Importing setting: %s", key)
+                if debug_enabled:
+                    logger.debug("Importing setting: %s", key)
                 apply_method(key, value)
 
         # Store loader key to prevent circular loading
-        self.SETTINGS_SOURCES.append(loader_key)
+        items["SETTINGS_SOURCES"].append(loader_key)
 
         # Handle instances of INCLUDE entries
-        include_settings = self.__dict__.pop("INCLUDE_SETTINGS", [])
+        include_settings = items.pop("INCLUDE_SETTINGS", [])
         if include_settings:
             for source_url in include_settings:
                 self.load(loaders.factory(source_url), apply_method)
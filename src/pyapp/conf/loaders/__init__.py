@@ -11,6 +11,7 @@ application settings.
 
 import importlib
 from collections.abc import Iterator
+from types import ModuleType
 from typing import Any
 
 from yarl import URL
@@ -25,10 +26,15 @@ from pyapp.typed_settings import SettingsDefType
 def settings_iterator(obj: object):
     """Iterate settings from an object"""
 
-    for key in dir(obj):
-        value = getattr(obj, key)
+    if isinstance(obj, ModuleType):
+        # Module attributes are all in the module dict; avoid dir/getattr
+        items = tuple(vars(obj).items())
+    else:
+        items = ((key, getattr(obj, key)) for key in dir(obj))
+
+    for key, value in items:
         if isinstance(value, SettingsDefType):
-            yield from getattr(value, "_settings", ())
+            yield from value._settings  # pylint: disable=protected-access
         elif key.isupper():
             yield key, value
 
@@ -46,6 +52,8 @@ class ModuleLoader(Loader):
 
     """
 
+    __slots__ = ("module",)
+
     scheme = "python"
 
     @classmethod
@@ -87,6 +95,8 @@ class ObjectLoader(Loader):
 
     """
 
+    __slots__ = ("obj",)
+
     @classmethod
     def from_url(cls, url: URL) -> "Loader":
         raise NotImplementedError("This loader does not support from_url.")
@@ -129,6 +139,15 @@ class SettingsLoaderRegistry(dict[str, LoaderType]):
         :raises: ValueError
 
         """
+        if isinstance(settings_url, str):
+            # Fast path for python module references; these are the common case
+            # and do not require a full URL parse.
+            scheme, sep, path = settings_url.partition(":")
+            if not sep:
+                return ModuleLoader(settings_url)
+            if self.get(scheme) is ModuleLoader:
+                return ModuleLoader(path)
+
         url = URL(settings_url)
         if not url.scheme:
             # If no scheme is defined assume python module
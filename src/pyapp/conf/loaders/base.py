@@ -16,6 +16,8 @@ class Loader(abc.ABC, Iterable[Tuple[str, Any]]):
     ABC class to define the loader interface.
     """
 
+    __slots__ = ()
+
     scheme: Union[str, Sequence[str]]
     """
     Scheme that this loader provides handling of.
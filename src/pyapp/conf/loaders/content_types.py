@@ -6,25 +6,13 @@ Used by File and HTTP loaders to handle both JSON and YAML content.
 
 """
 
-import mimetypes
+import posixpath
 from collections.abc import Callable, Sequence
 from json import load as json_load
-from pathlib import Path
 from typing import Any, TextIO
 
 from yarl import URL
 
-# Supported content types
-try:
-    from yaml import safe_load as yaml_load
-except ImportError:  # pragma: no cover
-    yaml_load = None
-
-try:
-    from toml import load as toml_load
-except ImportError:  # pragma: no cover
-    toml_load = None
-
 from pyapp.exceptions import UnsupportedContentType
 
 JSON_MIME_TYPE = "application/json"
@@ -38,6 +26,9 @@ UNOFFICIAL_CONTENT_TYPES = {
     ".yml": YAML_MIME_TYPE,
 }
 
+# Extensions of content types that have a built-in parser.
+_KNOWN_CONTENT_TYPES = {".json": JSON_MIME_TYPE, **UNOFFICIAL_CONTENT_TYPES}
+
 
 def content_type_from_url(url: URL) -> str:
     """
@@ -46,18 +37,61 @@ def content_type_from_url(url: URL) -> str:
     # Check for an explicit type
     file_type = url.query.get("type")
     if not file_type:
-        # Fallback to guessing based off the file name
-        file_type, _ = mimetypes.guess_type(url.path, strict=False)
+        # Check the types with built-in parsers first; this avoids loading the
+        # system mime types database for the common case.
+        _, extension = posixpath.splitext(url.path)
+        file_type = _KNOWN_CONTENT_TYPES.get(extension.lower())
         if not file_type:
-            # Try non-official source
-            extension = Path(url.path).suffix
-            file_type = UNOFFICIAL_CONTENT_TYPES.get(extension)
+            # Fallback to guessing based off the file name
+            import mimetypes  # pylint: disable=import-outside-toplevel
+
+            file_type, _ = mimetypes.guess_type(url.path, strict=False)
 
     return file_type
 
 
 ContentTypeParser = Callable[[TextIO], dict[str, Any]]
 
+# Optional parsers are imported on first use to avoid the import cost for
+# applications that do not load these formats.
+
+
+def yaml_load(fp: TextIO) -> dict[str, Any]:
+    """Parse YAML content (requires pyyaml); libyaml is used if available."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        from yaml import load
+    except ImportError:  # pragma: no cover
+        raise UnsupportedContentType(
+            f"No parser for `{YAML_MIME_TYPE}`; install pyyaml"
+        ) from None
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader
+
+    return load(fp, Loader=SafeLoader)
+
+
+def toml_load(fp: TextIO) -> dict[str, Any]:
+    """Parse TOML content (uses tomllib on Python 3.11+ else tomli or toml)."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        from tomllib import loads
+    except ImportError:  # pragma: no cover
+        try:
+            from tomli import loads
+        except ImportError:
+            try:
+                from toml import loads
+            except ImportError:
+                raise UnsupportedContentType(
+                    f"No parser for `{TOML_MIME_TYPE}`; install tomli"
+                ) from None
+
+    return loads(fp.read())
+
 
 class ContentTypeParserRegistry(dict[str, ContentTypeParser]):
     """
@@ -22,6 +22,11 @@ class SettingsReport:
 
     width = 96
 
+    # Indent of wrapped values, wrap_text also pads each line by a character
+    # either side; values up to value_width long fit on a single line.
+    value_indent = 25
+    value_width = width - value_indent - 2
+
     def __init__(
         self,
         verbose: bool = False,
@@ -61,15 +66,15 @@ class SettingsReport:
         """
         Output a result to output file.
         """
-        format_args = dict(
-            key=key,
-            setting=setting,
-            ppsetting=wrap_text(
-                pprint.pformat(setting, 2), width=self.width, indent=25
-            ).strip(),
-        )
+        ppsetting = pprint.pformat(setting, 2)
+        if len(ppsetting) > self.value_width or not ppsetting.isprintable():
+            # Only wrap values that do not fit on a single line
+            ppsetting = wrap_text(ppsetting, width=self.width, indent=self.value_indent)
+        ppsetting = ppsetting.strip()
 
-        self.f_out.write(self.basic_template.format(**format_args))
+        self.f_out.write(
+            self.basic_template.format(key=key, setting=setting, ppsetting=ppsetting)
+        )
 
     def run(self):
         """
@@ -1,6 +1,5 @@
 """Automated settings documentation."""
 import ast
-from functools import singledispatchmethod
 from pathlib import Path
 from types import ModuleType
 from typing import (
@@ -25,6 +24,15 @@ class _SettingsExtractor:
 
         self._current_setting: Optional[Tuple[str, Optional[str], Optional[str]]] = None
 
+        # Handlers for each node type; any other node ends the current setting
+        self._node_handlers = {
+            ast.Module: self._process_module,
+            ast.ClassDef: self._process_class_definition,
+            ast.Assign: self._process_assign,
+            ast.AnnAssign: self._process_annotated_assign,
+            ast.Expr: self._process_expr,
+        }
+
     def process(self):
         """Process the settings module or file."""
 
@@ -65,12 +73,14 @@ class _SettingsExtractor:
             self.setting(*self._current_setting, doc)
             self._current_setting = None
 
-    @singledispatchmethod
     def _process_node(self, node):
         """Process a node from the settings file."""
-        self._generate_setting()
+        handler = self._node_handlers.get(type(node))
+        if handler:
+            handler(node)
+        else:
+            self._generate_setting()
 
-    @_process_node.register
     def _process_module(self, node: ast.Module):
         """Process a module."""
         for item in node.body:
@@ -79,7 +89,6 @@ class _SettingsExtractor:
         # Ensure the last setting is generated
         self._generate_setting()
 
-    @_process_node.register
     def _process_class_definition(self, node: ast.ClassDef):
         """Process a class definition."""
 
@@ -97,7 +106,6 @@ class _SettingsExtractor:
             self._generate_setting()
             self.end_settings_def()
 
-    @_process_node.register
     def _process_assign(self, node: ast.Assign):
         """Process an assignment."""
 
@@ -112,7 +120,6 @@ class _SettingsExtractor:
                 )
                 break
 
-    @_process_node.register
     def _process_annotated_assign(self, node: ast.AnnAssign):
         """Process an annotated assignment."""
 
@@ -125,7 +132,6 @@ class _SettingsExtractor:
                 flatten_default_value(node.value),
             )
 
-    @_process_node.register
     def _process_expr(self, node: ast.Expr):
         """Process an expression."""
         if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
@@ -136,37 +142,37 @@ class _SettingsExtractor:
 
 def flatten_type_annotation(annotation) -> Optional[str]:
     """Flatten a type annotation to a string."""
-    if isinstance(annotation, ast.Name):
+    # AST node types are leaf classes so an exact type check is sufficient
+    node_type = type(annotation)
+
+    if node_type is ast.Name:
         return annotation.id
 
-    if isinstance(annotation, ast.Subscript):
-        if isinstance(annotation.value, ast.Name) and annotation.value.id == "Union":
-            # Compatibility with Python 3.8
-            slice_value = (
-                annotation.slice.value
-                if isinstance(annotation.slice, ast.Index)
-                else annotation.slice
-            )
-            if isinstance(slice_value, ast.Tuple):
-                return " | ".join(flatten_type_annotation(v) for v in slice_value.elts)
-        return f"{flatten_type_annotation(annotation.value)}"
+    if node_type is ast.Subscript:
+        value = annotation.value
+        if type(value) is ast.Name and value.id == "Union":
+            slice_value = annotation.slice
+            if type(slice_value) is ast.Tuple:
+                return " | ".join(map(flatten_type_annotation, slice_value.elts))
+        return f"{flatten_type_annotation(value)}"
 
     return None
 
 
 def flatten_default_value(value) -> Union[str, int, float, bool, list, dict, None]:
     """Flatten a default value to a string."""
+    node_type = type(value)
 
-    if isinstance(value, ast.Constant):
+    if node_type is ast.Constant:
         return value.value
 
-    if isinstance(value, ast.Name):
+    if node_type is ast.Name:
         return value.id
 
-    if isinstance(value, ast.Dict):
+    if node_type is ast.Dict:
         return {k.s: flatten_default_value(v) for k, v in zip(value.keys, value.values)}
 
-    if isinstance(value, (ast.List, ast.Tuple)):
+    if node_type is ast.List or node_type is ast.Tuple:
         return [flatten_default_value(v) for v in value.elts]
 
     return None
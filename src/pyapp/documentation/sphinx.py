@@ -1,4 +1,6 @@
 """Sphinx plugin to document elements of PyApp."""
+import functools
+import os
 from typing import Any, Final
 
 from sphinx.application import Sphinx
@@ -11,6 +13,13 @@ from .settings import SettingDef, SettingDefGroup, SettingsCollection
 DOC_SOURCE: Final[str] = "<autodoc-pyapp>"
 
 
+@functools.lru_cache(maxsize=128)
+def _collect_settings(file: str, mtime_ns: int) -> SettingsCollection:
+    """Collect settings from a file; the modified time invalidates the cache."""
+    # pylint: disable=unused-argument
+    return SettingsCollection(file).process()
+
+
 class SettingsDocumenter(ModuleDocumenter):
     """Sphinx autodoc class for documenting settings."""
 
@@ -33,28 +42,30 @@ class SettingsDocumenter(ModuleDocumenter):
     def add_block(self, lines: str):
         """Add a multi-line block of text to the output."""
 
+        add_line = self.add_line
         for line in lines.strip().splitlines():
-            self.add_line(line, DOC_SOURCE)
-        self.add_line("", DOC_SOURCE)
+            add_line(line, DOC_SOURCE)
+        add_line("", DOC_SOURCE)
 
     def document_setting(self, setting: SettingDef):
         """Document a setting definition."""
 
-        self.add_line(f"``{setting.key}``", DOC_SOURCE)
+        add_line = self.add_line
+        add_line(f"``{setting.key}``", DOC_SOURCE)
 
         old_indent = self.indent
         self.indent += self._extra_indent
 
         if setting.type_name is not None:
-            self.add_line(f"**Type**: :python:`{setting.type_name}`", DOC_SOURCE)
-            self.add_line("", DOC_SOURCE)
-        self.add_line(f"**Default**: :python:`{setting.default}`", DOC_SOURCE)
-        self.add_line("", DOC_SOURCE)
+            add_line(f"**Type**: :python:`{setting.type_name}`", DOC_SOURCE)
+            add_line("", DOC_SOURCE)
+        add_line(f"**Default**: :python:`{setting.default}`", DOC_SOURCE)
+        add_line("", DOC_SOURCE)
 
         if setting.doc is not None:
             self.add_block(setting.doc)
         else:
-            self.add_line("", DOC_SOURCE)
+            add_line("", DOC_SOURCE)
 
         self.indent = old_indent
 
@@ -66,8 +77,9 @@ class SettingsDocumenter(ModuleDocumenter):
             if self.options.get("sorted", False)
             else group.settings
         )
+        document_setting = self.document_setting
         for setting in settings:
-            self.document_setting(setting)
+            document_setting(setting)
 
     def document_group(self, group: SettingDefGroup):
         """Document a group of settings."""
@@ -89,7 +101,8 @@ class SettingsDocumenter(ModuleDocumenter):
 
     def document_members(self, all_members=False):
         """Update the document members section to include settings."""
-        collection = SettingsCollection(self.object).process()
+        file = self.object.__file__
+        collection = _collect_settings(file, os.stat(file).st_mtime_ns)
 
         # Define a code highlight role
         self.add_line(".. role:: python(code)", DOC_SOURCE)
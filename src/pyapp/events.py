@@ -46,11 +46,13 @@ Example::
     event.
 
 """
-import asyncio
+import logging
 from typing import Any, Callable, Coroutine, Generic, Optional, Set, TypeVar, Union
 
 __all__ = ("Event", "AsyncEvent", "listen_to", "Callback", "AsyncCallback", "bind_to")
 
+logger = logging.getLogger(__name__)
+
 _CT = TypeVar("_CT")
 _F = TypeVar("_F", bound=Callable[..., Any])
 
@@ -85,15 +87,14 @@ class _ListenerDescriptor:
                 f"calling __set_name__ on it."
             )
         try:
-            return instance.__dict__[self.name]
+            items = instance.__dict__
         except AttributeError:
             msg = (
                 f"No '__dict__' attribute on {type(instance).__name__!r} "
                 f"instance to store {self.name!r} events."
             )
             raise TypeError(msg) from None
-        except KeyError:
-            return None
+        return items.get(self.name)
 
     def set_listeners(self, instance, listeners):
         """Store listeners on instance."""
@@ -179,7 +180,7 @@ class Event(Generic[_CT], _ListenerDescriptor):
     __slots__ = ()
 
     def __get__(self, instance, owner) -> ListenerSet[_CT]:
-        if listeners := self.get_listeners(instance):
+        if (listeners := self.get_listeners(instance)) is not None:
             return listeners
         return self.set_listeners(instance, ListenerSet())
 
@@ -196,9 +197,15 @@ class AsyncListenerSet(BaseListenerSet[_ACT]):
         """
         Trigger event and call listeners.
         """
-        awaitables = [asyncio.create_task(c(*args, **kwargs)) for c in self]
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        awaitables = [c(*args, **kwargs) for c in self]
         if awaitables:
-            await asyncio.wait(awaitables, return_when=asyncio.ALL_COMPLETED)
+            # Exceptions are returned (not raised) so all listeners complete
+            results = await asyncio.gather(*awaitables, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error("Exception raised by event listener", exc_info=result)
 
 
 class AsyncEvent(Generic[_ACT], _ListenerDescriptor):
@@ -211,7 +218,7 @@ class AsyncEvent(Generic[_ACT], _ListenerDescriptor):
     __slots__ = ()
 
     def __get__(self, instance, owner) -> ListenerSet[_ACT]:
-        if listeners := self.get_listeners(instance):
+        if (listeners := self.get_listeners(instance)) is not None:
             return listeners
         return self.set_listeners(instance, AsyncListenerSet())
 
@@ -253,8 +260,9 @@ class CallbackBinding(CallbackBindingBase[_ACT]):
     __slots__ = ()
 
     def __call__(self, *args, **kwargs):
-        if self._callback:
-            return self._callback(*args, **kwargs)
+        callback = self._callback
+        if callback is not None:
+            return callback(*args, **kwargs)
         return None
 
 
@@ -268,7 +276,7 @@ class Callback(Generic[_CT], _ListenerDescriptor):
     __slots__ = ()
 
     def __get__(self, instance, owner) -> CallbackBinding[_CT]:
-        if listeners := self.get_listeners(instance):
+        if (listeners := self.get_listeners(instance)) is not None:
             return listeners
         return self.set_listeners(instance, CallbackBinding())
 
@@ -279,8 +287,10 @@ class AsyncCallbackBinding(CallbackBindingBase[_ACT]):
     __slots__ = ()
 
     async def __call__(self, *args, **kwargs):
-        if self._callback:
-            return await self._callback(*args, **kwargs)
+        callback = self._callback
+        if callback is not None:
+            return await callback(*args, **kwargs)
+        return None
 
 
 class AsyncCallback(Generic[_ACT], _ListenerDescriptor):
@@ -293,7 +303,7 @@ class AsyncCallback(Generic[_ACT], _ListenerDescriptor):
     __slots__ = ()
 
     def __get__(self, instance, owner) -> AsyncCallbackBinding[_ACT]:
-        if listeners := self.get_listeners(instance):
+        if (listeners := self.get_listeners(instance)) is not None:
             return listeners
         return self.set_listeners(instance, AsyncCallbackBinding())
 
@@ -50,16 +50,18 @@ class ExtensionDetail(NamedTuple):
 
         If the extension provides a callback point.
         """
-        if hasattr(self.extension, "register_commands"):
-            self.extension.register_commands(root)
+        callback = getattr(self.extension, "register_commands", None)
+        if callback is not None:
+            callback(root)
 
     def ready(self):
         """Generate a ready event to an extension.
 
         If the extension provides a callback point.
         """
-        if hasattr(self.extension, "ready"):
-            self.extension.ready()
+        callback = getattr(self.extension, "ready", None)
+        if callback is not None:
+            callback()
 
 
 class ExtensionEntryPoints:
@@ -110,14 +112,12 @@ class ExtensionRegistry(List[ExtensionDetail]):
     @property
     def default_settings(self) -> Sequence[str]:
         """Return a list of module loaders for extensions that specify default settings."""
-        return tuple(
-            module.default_settings for module in self if module.default_settings
-        )
+        return tuple(filter(None, (module.default_settings for module in self)))
 
     @property
     def check_locations(self) -> Sequence[str]:
         """Return a list of checks modules for extensions that specify checks."""
-        return tuple(module.checks_module for module in self if module.checks_module)
+        return tuple(filter(None, (module.checks_module for module in self)))
 
 
 # Shortcuts and global extension registry.
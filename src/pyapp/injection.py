@@ -125,12 +125,16 @@ class ModifyFactoryRegistryContext:
         return mock
 
 
-class FactoryRegistry(dict[type[AT_co], Callable]):
+class FactoryRegistry(dict[type[AT_co] | str, Callable]):
     """Registry of type factories."""
 
-    def register(self, abstract_type: type[AT_co], factory: FactoryFunc):
+    def register(self, abstract_type: type[AT_co] | str, factory: FactoryFunc):
         """Register a factory method for providing an abstract type.
 
+        The abstract type can also be referenced by its fully qualified name
+        (eg ``"asyncio.events.AbstractEventLoop"``), this allows a factory to be
+        registered without importing the module that defines the type.
+
         :param abstract_type: Type factory will produce
         :param factory: A factory that generates concrete instances based off the abstract type.
 
@@ -141,7 +145,13 @@ class FactoryRegistry(dict[type[AT_co], Callable]):
     def resolve(self, abstract_type: type[AT_co]) -> FactoryFunc | None:
         """Resolve an abstract type to a factory."""
 
-        return self.get(abstract_type)
+        factory = self.get(abstract_type)
+        if factory is None and isinstance(abstract_type, type):
+            # Fallback to a factory registered by name
+            factory = self.get(
+                f"{abstract_type.__module__}.{abstract_type.__qualname__}"
+            )
+        return factory
 
     def resolve_from_parameter(
         self, parameter: inspect.Parameter
@@ -155,14 +165,14 @@ class FactoryRegistry(dict[type[AT_co], Callable]):
                     "Only keyword-only arguments can be injected."
                 )
 
-            factory = self.get(parameter.annotation)
+            factory = self.resolve(parameter.annotation)
             if not factory:
                 raise InjectionSetupError("A type must be specified with `Args`")
 
             return functools.partial(factory, *default.args, **default.kwargs)
 
         # Ensure that the annotation is an ABC.
-        return self.get(parameter.annotation)
+        return self.resolve(parameter.annotation)
 
     def modify(self) -> ModifyFactoryRegistryContext:
         """
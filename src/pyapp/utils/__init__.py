@@ -4,8 +4,10 @@ PyApp Utils
 """
 
 import importlib
+import os
+import re
 import textwrap
-from fnmatch import fnmatch
+from fnmatch import translate
 from typing import Any, Container, Sequence
 
 
@@ -90,16 +92,31 @@ class AllowBlockFilter:
         self.allow_list = allow_list
         self.block_list = block_list
 
+        # Combine each list of glob patterns into a single expression
+        self._allow_match = self._compile(allow_list)
+        self._block_match = self._compile(block_list)
+
+    @staticmethod
+    def _compile(patterns: Sequence[str] | None):
+        """Compile glob patterns into a single match function."""
+        if patterns is None:
+            return None
+        if not patterns:
+            return lambda value: None
+        return re.compile(
+            "|".join(translate(os.path.normcase(pattern)) for pattern in patterns)
+        ).match
+
     def __call__(self, value: str) -> bool:
         """Check if a value is allowed"""
-        allow_list, block_list = self.allow_list, self.block_list
+        value = os.path.normcase(value)
 
-        if block_list is not None and any(
-            fnmatch(value, pattern) for pattern in block_list
-        ):
+        block_match = self._block_match
+        if block_match is not None and block_match(value):
             return False
 
-        if allow_list is not None:
-            return any(fnmatch(value, pattern) for pattern in self.allow_list)
+        allow_match = self._allow_match
+        if allow_match is not None:
+            return allow_match(value) is not None
 
         return True
@@ -3,8 +3,9 @@ Inspect Utils
 ~~~~~~~~~~~~~
 
 """
+import functools
 import importlib
-import inspect
+import sys
 from pathlib import Path
 
 
@@ -26,28 +27,33 @@ def find_root_folder(start_file: Path):
     return package_path
 
 
-def import_root_module(stack_offset: int = 2):
+@functools.cache
+def _resolve_root_package(package_name: str, file_name: str, name: str) -> str:
     """
-    Identify and import the root module.
+    Resolve the name of the root package from a modules globals.
     """
-    stack = inspect.stack()
-    frame_globals = stack[stack_offset].frame.f_globals
-    package_name = frame_globals.get("__package__")
-
     if package_name:
-        root_package = package_name.split(".")[0]
-
-    else:
-        # Likely the __main__ module, this module is different and does not contain
-        # the package name some assumptions need to be made.
-        try:
-            root_package = find_root_folder(Path(frame_globals.get("__file__"))).name
-        except ValueError as ex:
-            # If the module name is __main__ this is a standalone script.
-            name = frame_globals.get("__name__")
-            if name in ("__main__", "__mp_main__"):
-                root_package = name
-            else:
-                raise RuntimeError(f"Unable to determine root module: {ex}") from ex
+        return package_name.split(".")[0]
+
+    # Likely the __main__ module, this module is different and does not contain
+    # the package name some assumptions need to be made.
+    try:
+        return find_root_folder(Path(file_name)).name
+    except ValueError as ex:
+        # If the module name is __main__ this is a standalone script.
+        if name in ("__main__", "__mp_main__"):
+            return name
+        raise RuntimeError(f"Unable to determine root module: {ex}") from ex
+
 
+def import_root_module(stack_offset: int = 2):
+    """
+    Identify and import the root module.
+    """
+    frame_globals = sys._getframe(stack_offset).f_globals
+    root_package = _resolve_root_package(
+        frame_globals.get("__package__"),
+        frame_globals.get("__file__"),
+        frame_globals.get("__name__"),
+    )
     return importlib.import_module(root_package)
@@ -1,4 +1,7 @@
+import logging
+
 import pytest
+from pyapp import app as app_module
 from pyapp import feature_flags
 from pyapp.app import CliApplication, _key_help, argument
 from pyapp.app.logging_formatter import ColourFormatter
@@ -16,6 +19,21 @@ def test_key_help(monkeypatch, key, expected):
     assert actual == expected
 
 
+def test_star_import():
+    namespace = {}
+    exec("from pyapp.app import *", namespace)  # noqa: S102
+
+    assert namespace["CliApplication"] is CliApplication
+    assert "argument" in namespace
+
+
+def test_dir():
+    actual = dir(app_module)
+
+    assert "CliApplication" in actual
+    assert "get_running_application" in actual
+
+
 class TestCliApplication:
     def test_initialisation(self):
         target = CliApplication(tests.unit.sample_app)
@@ -143,6 +161,19 @@ class TestCliApplication:
 
         assert ex.value.code == 20
 
+    def test_dispatch__checks_on_startup(self, caplog):
+        target = tests.unit.sample_app.__main__.app
+
+        with pytest.raises(SystemExit) as ex:
+            target.dispatch(args=("--checks", "happy"))
+
+        assert ex.value.code == 4
+        (record,) = [
+            r for r in caplog.records if r.getMessage().startswith("Check results:")
+        ]
+        assert record.levelno == logging.ERROR
+        assert "Critical message" in record.getMessage()
+
     def test_get_log_formatter__force_colour(self):
         target = tests.unit.sample_app.__main__.app
 
@@ -161,6 +192,17 @@ class TestCliApplication:
         target.dispatch(args=("--log-level", "WARN", "settings"))
         assert logging.root.level == logging.WARN
 
+    def test_configure_logging__only_applied_once(self):
+        import logging
+
+        target = CliApplication(tests.unit.sample_app)
+
+        target.dispatch(args=("--log-level", "WARN", "settings"))
+        target.dispatch(args=("--log-level", "DEBUG", "settings"))
+
+        assert logging.root.level == logging.WARN
+        assert logging.root.handlers.count(target.default_log_handler) == 1
+
     @pytest.mark.parametrize(
         "kwargs, expected",
         (
@@ -201,3 +243,13 @@ class TestCliApplication:
         target = CliApplication(tests.unit.sample_app, prog="testing")
 
         assert repr(target) == "CliApplication(<module tests.unit.sample_app>)"
+
+    def test_global_arguments__not_shared_between_instances(self):
+        target_a = CliApplication(tests.unit.sample_app, prog="testing")
+        target_b = CliApplication(tests.unit.sample_app, prog="testing")
+
+        target_a.parser.set_defaults(log_level="ERROR", checks_message_level="DEBUG")
+        actual = target_b.parser.parse_args(["settings"])
+
+        assert actual.log_level != "ERROR"
+        assert actual.checks_message_level == "INFO"
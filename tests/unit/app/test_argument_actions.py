@@ -47,6 +47,20 @@ class TestKeyValueAction:
         with pytest.raises(ArgumentError):
             target(parser, namespace, value)
 
+    def test_call__subclass_parse_value(self):
+        class UpperKeyValueAction(argument_actions.KeyValueAction):
+            def parse_value(self, value):
+                key, value = super().parse_value(value)
+                return key.upper(), value
+
+        parser = ArgumentParser()
+        namespace = Namespace()
+        target = UpperKeyValueAction(option_strings="--option", dest="options")
+
+        target(parser, namespace, ("x=1", "y=2"))
+
+        assert namespace.options == {"X": "1", "Y": "2"}
+
 
 class Colour(Enum):
     Red = "red"
@@ -79,13 +93,17 @@ class TestEnumActions:
     def test_init__value_choices(self, value_target):
         assert value_target.choices == ("red", "green", "blue")
 
-    def test_init__invalid_choices(self):
+    @pytest.mark.parametrize(
+        "choices",
+        ((Colour.Blue, "Pink"), (Colour.Blue, "red"), (Colour.Blue, IntColour.Red)),
+    )
+    def test_init__invalid_choices(self, choices):
         with pytest.raises(ValueError, match="choices contains a non"):
             argument_actions.EnumName(
                 option_strings="--colour",
                 dest="colour",
                 type=Colour,
-                choices=(Colour.Blue, "Pink"),
+                choices=choices,
             )
 
     def test_init__valid_choices(self):
@@ -133,6 +151,40 @@ class TestEnumActions:
 
         assert namespace.colour == IntColour.Blue
 
+    def test_call__value_with_missing_handler(self):
+        class CaseColour(Enum):
+            Red = "red"
+            Blue = "blue"
+
+            @classmethod
+            def _missing_(cls, value):
+                return cls(value.lower())
+
+        target = argument_actions.EnumValue(
+            option_strings="--colour", dest="colour", type=CaseColour
+        )
+        parser = ArgumentParser()
+        namespace = Namespace()
+
+        target(parser, namespace, "BLUE")
+
+        assert namespace.colour == CaseColour.Blue
+
+    def test_call__name_with_unhashable_values(self):
+        class Palette(Enum):
+            Warm = ["red", "orange"]
+            Cool = ["blue", "green"]
+
+        target = argument_actions.EnumName(
+            option_strings="--palette", dest="palette", type=Palette
+        )
+        parser = ArgumentParser()
+        namespace = Namespace()
+
+        target(parser, namespace, "Cool")
+
+        assert namespace.palette == Palette.Cool
+
 
 class TestAppendEnumActions:
     @pytest.fixture
@@ -163,6 +215,19 @@ class TestAppendEnumActions:
 
         assert namespace.colours == [Colour.Red, Colour.Blue]
 
+    def test_call__default_not_modified(self):
+        default = [Colour.Blue]
+        target = argument_actions.AppendEnumName(
+            option_strings="--colours", dest="colours", type=Colour, default=default
+        )
+        parser = ArgumentParser()
+        namespace = Namespace(colours=default)
+        target(parser, namespace, "Green")
+        target(parser, namespace, "Red")
+
+        assert namespace.colours == [Colour.Blue, Colour.Green, Colour.Red]
+        assert default == [Colour.Blue]
+
 
 class TestDateTimeActions:
     @pytest.mark.parametrize(
@@ -195,3 +260,18 @@ class TestDateTimeActions:
         target(parser, namespace, value)
 
         assert namespace.actual == expected
+
+    def test_call__custom_parser_function(self):
+        def parse_year(value):
+            return datetime.date(int(value), 1, 1)
+
+        class YearAction(argument_actions._DateTimeAction):
+            parser = parse_year
+
+        parser = ArgumentParser()
+        namespace = Namespace()
+        target = YearAction(option_strings="--actual", dest="actual")
+
+        target(parser, namespace, "2022")
+
+        assert namespace.actual == datetime.date(2022, 1, 1)
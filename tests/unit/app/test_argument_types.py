@@ -12,7 +12,7 @@ class TestRegexType:
 
         assert actual == "abc"
 
-    @pytest.mark.parametrize("value", ("123", "1abc2"))
+    @pytest.mark.parametrize("value", ("123", "1abc2", "abc1"))
     def test_invalid_value(self, value):
         target = argument_types.RegexType(r"[a-z]+")
 
@@ -24,3 +24,20 @@ class TestRegexType:
 
         with pytest.raises(ArgumentTypeError, match="Value not alpha"):
             target("123")
+
+    def test_subclass_init(self):
+        class HexType(argument_types.RegexType):
+            def __init__(self):
+                super().__init__(r"[a-f0-9]+", "Value not hex")
+
+        target = HexType()
+
+        assert target("abc123") == "abc123"
+        with pytest.raises(ArgumentTypeError, match="Value not hex"):
+            target("xyz")
+
+    def test_patterns_shared(self):
+        assert (
+            argument_types.RegexType(r"[a-z]+")._re
+            is argument_types.RegexType(r"[a-z]+")._re
+        )
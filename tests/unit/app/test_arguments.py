@@ -1,4 +1,10 @@
 import argparse
+import functools
+import gc
+import inspect
+import logging
+import weakref
+from typing import Literal
 from unittest import mock
 
 import pytest
@@ -29,7 +35,135 @@ class TestCommandProxy:
         mock_parser = mock.Mock()
         arguments.CommandProxy(sample_handler, mock_parser)
 
-        assert mock_parser.add_argument.call_count == 2
+        assert mock_parser.add_argument.mock_calls == [
+            mock.call("--foo", dest="foo", help="Foo option"),
+            mock.call("--bar", dest="bar", help="Bar option"),
+        ]
+
+    def test_signature_cached(self):
+        def sample_handler(*, foo: str):
+            pass
+
+        arguments.CommandProxy(sample_handler, mock.Mock())
+        with mock.patch.object(arguments.inspect, "signature") as signature:
+            arguments.CommandProxy(sample_handler, mock.Mock())
+
+        signature.assert_not_called()
+
+    def test_signature_cache_does_not_keep_handler(self):
+        def sample_handler(*, foo: str):
+            pass
+
+        arguments.CommandProxy(sample_handler, mock.Mock())
+        handler_ref = weakref.ref(sample_handler)
+        del sample_handler
+        gc.collect()
+
+        assert handler_ref() is None
+
+    def test_literal_choices_keep_order(self):
+        def handler_a(*, foo: Literal["a", "b"]):
+            pass
+
+        def handler_b(*, bar: Literal["b", "a"]):
+            pass
+
+        arguments.CommandProxy(handler_a, mock.Mock())
+        mock_parser = mock.Mock()
+        arguments.CommandProxy(handler_b, mock_parser)
+
+        assert mock_parser.add_argument.mock_calls == [
+            mock.call("--bar", type=str, choices=("b", "a")),
+        ]
+
+    def test_parameter_arguments_cached(self):
+        def sample_handler(*, foo: str):
+            pass
+
+        mock_parser = mock.Mock()
+        arguments.CommandProxy(sample_handler, mock_parser)
+        with mock.patch.object(arguments.Argument, "from_parameter") as from_parameter:
+            arguments.CommandProxy(sample_handler, mock_parser)
+
+        from_parameter.assert_not_called()
+        assert mock_parser.add_argument.mock_calls == [
+            mock.call("--foo", type=str, required=True),
+            mock.call("--foo", type=str, required=True),
+        ]
+
+    def test_call__non_identifier_dest(self):
+        def sample_handler(*, foo: str):
+            return foo
+
+        parser = argparse.ArgumentParser()
+        target = arguments.CommandProxy(sample_handler, parser)
+        target._args = [("foo", "foo.bar")]
+
+        assert target(argparse.Namespace(**{"foo.bar": "eek"})) == "eek"
+
+    def test_call__caller_shared(self):
+        def handler_a(*, foo: str, opts: argparse.Namespace):
+            return "a", foo, opts
+
+        def handler_b(*, foo: str, opts: argparse.Namespace):
+            return "b", foo, opts
+
+        opts = argparse.Namespace(foo="eek")
+        target_a = arguments.CommandProxy(handler_a, argparse.ArgumentParser())
+        target_b = arguments.CommandProxy(handler_b, argparse.ArgumentParser())
+
+        assert target_a(opts) == ("a", "eek", opts)
+        assert target_b(opts) == ("b", "eek", opts)
+        assert target_a._call is target_b._call
+
+
+def _legacy_untyped(opts):
+    pass
+
+
+def _legacy_typed(args: argparse.Namespace) -> int:
+    pass
+
+
+def _typed(opts: int):
+    pass
+
+
+def _keyword_only(*, opts):
+    pass
+
+
+def _var_args(*opts):
+    pass
+
+
+@functools.wraps(_legacy_untyped)
+def _wrapped(*args, **kwargs):
+    pass
+
+
+def _signature_override(opts):
+    pass
+
+
+_signature_override.__signature__ = inspect.signature(_typed)
+
+
+@pytest.mark.parametrize(
+    "func, expected",
+    (
+        (_legacy_untyped, "opts"),
+        (_legacy_typed, "args"),
+        (_typed, None),
+        (_keyword_only, None),
+        (_var_args, None),
+        (_wrapped, None),
+        (_signature_override, None),
+        (mock.Mock(), None),
+    ),
+)
+def test_legacy_namespace_name(func, expected):
+    assert arguments._legacy_namespace_name(func) == expected
 
 
 class TestAsyncCommandProxy:
@@ -86,6 +220,27 @@ class TestCommandGroup:
 
         assert actual.handler_dest == ":handler:foo:bar"
 
+    def test_resolve_handler__nested(self, target: arguments.CommandGroup):
+        group = target.create_command_group("foo")
+
+        @group.command(loglevel=logging.DEBUG)
+        def bar():
+            return 13
+
+        opts = target.parser.parse_args(["foo", "bar"])
+        actual = target.resolve_handler(opts)
+
+        assert actual is bar
+        assert actual.loglevel == logging.DEBUG
+        assert target.dispatch_handler(opts) == 13
+
+    def test_resolve_handler__nested_default(self, target: arguments.CommandGroup):
+        group = target.create_command_group("foo")
+
+        actual = target.resolve_handler(target.parser.parse_args(["foo"]))
+
+        assert actual == group.default_handler
+
     def test_default(self, target: arguments.CommandGroup):
         @target.default
         def my_default(args):
@@ -148,6 +303,24 @@ class TestCommandGroup:
 
         assert actual == 42
 
+    def test_dispatch_handler__unhashable_callable(
+        self, target: arguments.CommandGroup
+    ):
+        class Known:
+            __name__ = "known"
+
+            def __eq__(self, other):
+                return isinstance(other, Known)
+
+            def __call__(self, args) -> int:
+                return 42
+
+        target.command(Known())
+
+        actual = target.dispatch_handler(argparse.Namespace(**{":handler:": "known"}))
+
+        assert actual == 42
+
     def test_dispatch_handler__async(self, target: arguments.CommandGroup):
         @target.command
         async def known(args) -> int:
@@ -2,7 +2,7 @@ import argparse
 import datetime
 from argparse import FileType
 from enum import Enum
-from typing import Callable, Dict, Literal, Optional, Sequence, Tuple, Union
+from typing import Callable, Deque, Dict, Literal, Optional, Sequence, Tuple, Union
 from unittest import mock
 
 import pytest
@@ -307,6 +307,23 @@ def func_sample_35(
     return arg_1, arg_2, arg_3
 
 
+@expected_args(mock.call("--arg1", type=str, action="append"))
+def func_sample_36(*, arg1: Deque[str]):
+    return arg1
+
+
+@expected_args(mock.call("ARG1", type=str, nargs="?"))
+@call_args(expected=None)
+def func_sample_38(arg1: str | None):
+    return arg1
+
+
+@expected_args(mock.call("--arg1", type=str, default=None))
+@call_args("--arg1", "eek", expected="eek")
+def func_sample_39(*, arg1: str | None):
+    return arg1
+
+
 @pytest.mark.parametrize(
     "handler, expected",
     (
@@ -354,6 +371,9 @@ def test_from_parameter__compatibility(handler, expected):
         func_sample_25,
         func_sample_26,
         func_sample_35,
+        func_sample_36,
+        func_sample_38,
+        func_sample_39,
     ),
 )
 def test_from_parameter__typed(handler):
@@ -455,6 +475,8 @@ def test_from_parameter__unsupported_literal_value_type():
         func_sample_24,
         func_sample_25,
         func_sample_35,
+        func_sample_38,
+        func_sample_39,
     ),
 )
 def test_called(handler):
@@ -0,0 +1,43 @@
+import pytest
+
+import tests
+from pyapp.app import cli_entry
+
+
+class TestMain:
+    def test_version(self, monkeypatch, capsys):
+        monkeypatch.setattr(tests, "__version__", "1.2.3", raising=False)
+
+        with pytest.raises(SystemExit) as ex:
+            cli_entry.main(
+                "tests.unit.sample_app.__main__:app", prog="testing", args=["--version"]
+            )
+
+        assert ex.value.code == 0
+        assert capsys.readouterr().out == "testing version: 1.2.3\n"
+
+    def test_version__override(self, capsys):
+        with pytest.raises(SystemExit):
+            cli_entry.main(
+                "tests.unit.sample_app.__main__:app",
+                prog="testing",
+                version="3.2.1",
+                args=["--version"],
+            )
+
+        assert capsys.readouterr().out == "testing version: 3.2.1\n"
+
+    def test_dispatch(self, capsys):
+        cli_entry.main("tests.unit.sample_app.__main__:app", args=["happy"])
+
+        assert capsys.readouterr().out == "=o)\n"
+
+    def test_dispatch__return_status(self):
+        with pytest.raises(SystemExit) as ex:
+            cli_entry.main("tests.unit.sample_app.__main__:app", args=["sad"])
+
+        assert ex.value.code == -2
+
+    def test_invalid_reference(self):
+        with pytest.raises(ValueError):
+            cli_entry.main("tests.unit.sample_app.__main__", args=["happy"])
@@ -18,3 +18,46 @@ class TestInitHandler:
         target.handle(record)
 
         mock_handler.emit.assert_called_with(record)
+
+    def test_replay(self, caplog):
+        """
+        Given stored records ensure they are replayed and released
+        """
+        target = init_logger.InitHandler(Mock())
+        record = logging.LogRecord(
+            "Foo", logging.ERROR, "path.to.module", 42, "Bar", {}, None
+        )
+        target.handle(record)
+
+        target.replay()
+
+        assert caplog.records == [record]
+        assert not target._store
+
+    def test_max_records(self):
+        """
+        Given more records than the maximum ensure only the latest are kept
+        """
+        target = init_logger.InitHandler(Mock(), max_records=2)
+        records = [
+            logging.LogRecord("Foo", logging.INFO, "path.to.module", 42, msg, {}, None)
+            for msg in ("Bar", "Eek", "Ook")
+        ]
+
+        for record in records:
+            target.handle(record)
+
+        assert list(target._store) == records[1:]
+
+    def test_store_level(self):
+        """
+        Given a record below the store level ensure it is not stored
+        """
+        target = init_logger.InitHandler(Mock(), store_level=logging.INFO)
+        record = logging.LogRecord(
+            "Foo", logging.DEBUG, "path.to.module", 42, "Bar", {}, None
+        )
+
+        target.handle(record)
+
+        assert not target._store
@@ -49,6 +49,30 @@ class TestCheckRegistry:
         assert my_check_func in target
         assert len(my_check_func._check__tags) == 2
 
+    def test_register__same_check_additional_tags(self):
+        target = registry.CheckRegistry()
+
+        @target.register("foo")
+        def my_check_func(**kwargs):
+            pass
+
+        target.register(my_check_func, "bar")
+
+        assert len(target) == 1
+        assert my_check_func._check__tags == {"foo", "bar"}
+
+    def test_register__after_clear(self):
+        target = registry.CheckRegistry()
+
+        def my_check_func(**kwargs):
+            pass
+
+        target.register(my_check_func)
+        target.clear()
+        target.register(my_check_func)
+
+        assert target == [my_check_func]
+
     def test_register__attached_check(self):
         target = registry.CheckRegistry()
 
@@ -98,3 +98,11 @@ class TestCheckMessage:
         assert (target.level_name, target.msg) == ("ERROR", "Unhandled Exception")
         assert target.hint.startswith("Traceback (most recent call last):")
         assert target.hint.endswith("RuntimeError: Didn't see that one!\n")
+
+    def test_exc_info__explicit_hint(self):
+        try:
+            exception_check()
+        except Exception:
+            target = messages.UnhandledException(hint="Check the thing")
+
+        assert target.hint == "Check the thing"
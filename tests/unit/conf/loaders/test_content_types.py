@@ -1,3 +1,4 @@
+from io import StringIO
 from unittest import mock
 
 import pytest
@@ -62,3 +63,26 @@ class TestContentTypeParserRegistry:
         assert "application/json" in target
         assert target["text/plain"] is content_types.json_load
         assert target["application/json"] is content_types.json_load
+
+
+@pytest.mark.parametrize(
+    "content, content_type",
+    (
+        ('{"foo": 1}', content_types.JSON_MIME_TYPE),
+        ("foo = 1", content_types.TOML_MIME_TYPE),
+        ("foo: 1", content_types.YAML_MIME_TYPE),
+    ),
+)
+def test_registry__parse_file(content, content_type):
+    actual = content_types.registry.parse_file(StringIO(content), content_type)
+
+    assert actual == {"foo": 1}
+
+
+def test_registry__parse_file__json_large_int():
+    actual = content_types.registry.parse_file(
+        StringIO('{"foo": 123456789012345678901234567890}'),
+        content_types.JSON_MIME_TYPE,
+    )
+
+    assert actual == {"foo": 123456789012345678901234567890}
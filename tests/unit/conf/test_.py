@@ -174,11 +174,35 @@ class TestSettings:
             "python:tests.settings"
         ] == target.SETTINGS_SOURCES, "Sources not restored"
 
+    def test_modify__changes_around_reset_settings(
+        self, target: pyapp.conf.Settings
+    ):
+        initial_keys = target.keys
+
+        with target.modify() as patch:
+            patch.SETTING_1 = 10
+            patch.SETTING_6 = 60
+            del patch.SETTING_3
+            patch.reset_settings()
+            patch.SETTING_2 = 20
+
+        assert sorted(initial_keys) == sorted(target.keys)
+        assert target.SETTING_1 == 1
+        assert target.SETTING_2 == 2
+        assert target.SETTING_3 == 3
+        assert not hasattr(target, "SETTING_6")
+
     def test_getitem(self, target: pyapp.conf.Settings):
         actual = target["UPPER_VALUE"]
 
         assert actual == "foo"
 
+    def test_items(self, target: pyapp.conf.Settings):
+        actual = list(target.items())
+
+        assert [key for key, _ in actual] == sorted(target.keys)
+        assert ("UPPER_VALUE", "foo") in actual
+
 
 class TestExportRestoreSettings:
     def test_roundtrip_default_serialiser(self, monkeypatch):
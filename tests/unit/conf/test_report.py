@@ -1,8 +1,37 @@
+import pprint
+from io import StringIO
+
 import pytest
 
+from pyapp.conf import report
+from pyapp.utils import wrap_text
 from tests.unit.sample_app.__main__ import app
 
 
 @pytest.mark.parametrize("args", (("settings",), ("--nocolor", "settings")))
 def test_run_report_from_app(args):
     app.dispatch(args=args)
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "foo",
+        42,
+        None,
+        " padded ",
+        "line\nbreak",
+        "x" * (report.SettingsReport.value_width - 2),
+        "x" * (report.SettingsReport.value_width - 1),
+        ["a" * 20, "b" * 20, "c" * 20, "d" * 20],
+        {f"key_{idx}": "value" * idx for idx in range(10)},
+    ),
+)
+def test_output_result__matches_wrapped_text(value):
+    f_out = StringIO()
+    target = report.SettingsReport(no_color=True, f_out=f_out)
+
+    target.output_result("KEY", value)
+
+    expected = wrap_text(pprint.pformat(value, 2), width=96, indent=25).strip()
+    assert f_out.getvalue() == f"KEY                  : {expected}\n"
@@ -6,3 +6,13 @@ class TestSettingsDocumenter:
         actual = sphinx.SettingsDocumenter.can_document_member(None, "foo", False, None)
 
         assert actual is False
+
+
+class TestCollectSettings:
+    def test_cached_until_modified(self, fixture_path):
+        file = str(fixture_path / "settings" / "default_settings.py")
+
+        first = sphinx._collect_settings(file, 1)
+
+        assert sphinx._collect_settings(file, 1) is first
+        assert sphinx._collect_settings(file, 2) is not first
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from pyapp import compatability
 
@@ -12,3 +14,20 @@ def test_async_run__not_a_coroutine():
 
     with pytest.raises((ValueError, TypeError)):
         compatability.async_run(example)
+
+
+def test_async_run__forwards_arguments():
+    """
+    Given additional arguments pass them through to asyncio.run
+    """
+
+    async def example():
+        pass
+
+    coroutine = example()
+    with mock.patch("asyncio.run", return_value=42) as run:
+        actual = compatability.async_run(coroutine, debug=True, loop_factory=None)
+    coroutine.close()
+
+    assert actual == 42
+    run.assert_called_once_with(coroutine, debug=True, loop_factory=None)
@@ -1,4 +1,5 @@
 from typing import Awaitable, Callable
+from unittest import mock
 
 import pytest
 from pyapp import events
@@ -100,6 +101,14 @@ class TestEvent:
 
         assert len(instance.target) == 1
 
+    def test_get__empty_set_is_reused(self):
+        class MyObject:
+            target = events.Event[Callable[[], None]]()
+
+        instance = MyObject()
+
+        assert instance.target is instance.target
+
     def test__when_object_has_slots(self):
         class MyObject:
             __slots__ = ("foo",)
@@ -131,6 +140,37 @@ class TestAsyncListenerSet:
 
         await target("foo")
 
+    @pytest.mark.asyncio
+    async def test_call__listener_error_does_not_stop_others(self):
+        actual = []
+        target = events.AsyncListenerSet()
+
+        @events.listen_to(target)
+        async def on_target_error(value):
+            raise ValueError(value)
+
+        @events.listen_to(target)
+        async def on_target(value):
+            actual.append(value)
+
+        await target("foo")
+
+        assert actual == ["foo"]
+
+    @pytest.mark.asyncio
+    async def test_call__listener_error_is_logged(self):
+        target = events.AsyncListenerSet()
+
+        @events.listen_to(target)
+        async def on_target_error(value):
+            raise ValueError(value)
+
+        with mock.patch.object(events, "logger") as logger:
+            await target("foo")
+
+        logger.error.assert_called_once()
+        assert isinstance(logger.error.call_args.kwargs["exc_info"], ValueError)
+
 
 class TestAsyncEvent:
     def test_get(self):
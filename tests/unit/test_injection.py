@@ -53,6 +53,14 @@ class TestFactoryRegistry:
 
         assert actual is expected
 
+    def test_resolve__registered_by_name(self):
+        target = injection.FactoryRegistry()
+        target.register(f"{__name__}.ThingBase", thing_factory)
+
+        actual = target.resolve(ThingBase)
+
+        assert actual is thing_factory
+
     def test_modify(self):
         with local_registry.modify() as patch:
             mock = patch.mock_type(ThingBase)
@@ -79,6 +79,13 @@ class TestAllowBlockFilter:
             (["foo*"], ["bar*"], "bar", False),
             (["foo*"], ["bar*"], "barfoo", False),
             (["foo*"], ["bar*"], "eek", False),
+            # Multiple patterns
+            (["foo", "eek?"], None, "eeks", True),
+            (["foo", "eek?"], None, "eek", False),
+            (None, ["foo", "bar*"], "barfoo", False),
+            # Empty lists
+            ([], None, "foo", False),
+            (None, [], "foo", True),
         ),
     )
     def test_filtering(self, allow_list, block_list, value, expected):
@@ -34,12 +34,18 @@ def test_import_root_module__current_module():
     assert actual is tests
 
 
-def test_import_root_module__single_file(monkeypatch):
-    stack_mock = mock.Mock()
-    stack_mock.frame.f_globals = {"__name__": "__main__", "__file__": "/foo/bar.py"}
-    monkeypatch.setattr(
-        inspect.inspect, "stack", mock.Mock(return_value=[None, None, stack_mock])
-    )
+@pytest.fixture
+def frame_globals(monkeypatch):
+    frame_mock = mock.Mock()
+    sys_mock = mock.Mock(**{"_getframe.return_value": frame_mock})
+    monkeypatch.setattr(inspect, "sys", sys_mock)
+    inspect._resolve_root_package.cache_clear()
+    yield frame_mock
+    inspect._resolve_root_package.cache_clear()
+
+
+def test_import_root_module__single_file(monkeypatch, frame_globals):
+    frame_globals.f_globals = {"__name__": "__main__", "__file__": "/foo/bar.py"}
     monkeypatch.setattr(
         inspect, "find_root_folder", mock.Mock(side_effect=ValueError("EEK!"))
     )
@@ -49,13 +55,23 @@ def test_import_root_module__single_file(monkeypatch):
     assert actual == __import__("__main__")
 
 
-def test_import_root_module__unknown(monkeypatch):
-    stack_mock = mock.Mock()
-    stack_mock.frame.f_globals = {"__name__": "foo", "__file__": "/foo/bar.py"}
-    monkeypatch.setattr(inspect.inspect, "stack", mock.Mock(return_value=[stack_mock]))
+def test_import_root_module__unknown(monkeypatch, frame_globals):
+    frame_globals.f_globals = {"__name__": "foo", "__file__": "/foo/bar.py"}
     monkeypatch.setattr(
         inspect, "find_root_folder", mock.Mock(side_effect=ValueError("EEK!"))
     )
 
     with pytest.raises(RuntimeError, match="Unable to determine root module"):
-        inspect.import_root_module(-1)
+        inspect.import_root_module()
+
+
+def test_import_root_module__resolution_cached(monkeypatch, frame_globals):
+    frame_globals.f_globals = {"__name__": "__main__", "__file__": "/foo/bar.py"}
+    find_root_folder = mock.Mock(return_value=Path(tests.__file__).parent)
+    monkeypatch.setattr(inspect, "find_root_folder", find_root_folder)
+
+    inspect.import_root_module()
+    actual = inspect.import_root_module()
+
+    assert actual is tests
+    find_root_folder.assert_called_once()